@@ -0,0 +1,36 @@
+import time
+from datetime import datetime
+from typing import NamedTuple
+
+from cachetools import TTLCache
+
+
+class TokenInfo(NamedTuple):
+    """Detached snapshot of an `AdminAccessTokens` row."""
+
+    id: str
+    token: str
+    expiry: datetime
+
+
+# Verified tokens keyed by their stored hash. Entries live for at most a
+# minute, so a token deleted outside `AuthService.invalidate_jwt` is honoured
+# for no longer than that. The expiry is kept as epoch seconds alongside the
+# snapshot so hits compare against `time.time()`.
+_cache: TTLCache[str, tuple[TokenInfo, float]] = TTLCache(maxsize=10_000, ttl=60)
+
+
+def get(token: str) -> TokenInfo | None:
+    """Return the cached snapshot for `token` if it has not expired."""
+    entry = _cache.get(token)
+    if entry and entry[1] > time.time():
+        return entry[0]
+    return None
+
+
+def put(token: TokenInfo) -> None:
+    _cache[token.token] = (token, token.expiry.timestamp())
+
+
+def pop(token: str) -> None:
+    _cache.pop(token, None)
@@ -1,13 +1,15 @@
-from datetime import datetime, timezone
 from typing_extensions import Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-import jwt
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from apps.auth import _token_cache
+from apps.auth._token_cache import TokenInfo
 from apps.auth.models import AdminAccessTokens
+from apps.auth.service import hash_token
 from apps.settings import settings
-from core.database.sqlalchamey.core import SessionDep
+from core.database.sqlalchamey.core import AsyncSessionLocal, SessionDep
 
 # Replace with your secret key
 SECRET_KEY = settings.SECRET_KEY
@@ -15,37 +17,45 @@ SECRET_KEY = settings.SECRET_KEY
 security = HTTPBearer()
 
 
+async def _lookup_token(session: AsyncSession, token_hash: str) -> TokenInfo:
+    query = select(AdminAccessTokens).where(
+        AdminAccessTokens.token == token_hash,
+        AdminAccessTokens.expiry > func.now(),
+    )
+    token_entry = await session.scalar(query)
+    if not token_entry:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+        )
+    snapshot = TokenInfo(token_entry.id, token_entry.token, token_entry.expiry)
+    _token_cache.put(snapshot)
+    return snapshot
+
+
 async def verify_jwt_token(
     session: SessionDep,
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ):
-    try:
-        query = select(AdminAccessTokens).where(
-            AdminAccessTokens.token == credentials.credentials
-        )
-        result = await session.execute(query)
-        token_entry = result.scalars().first()
-        if not token_entry:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired token",
-            )
-        if not token_entry.expiry or token_entry.expiry < datetime.now(timezone.utc):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token has expired",
-            )
-        return token_entry
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token has expired",
-        )
-    except jwt.InvalidTokenError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token",
-        )
+    token_hash = hash_token(credentials.credentials)
+    return _token_cache.get(token_hash) or await _lookup_token(session, token_hash)
+
+
+async def verify_cached_token(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+):
+    """
+    Same check as `verify_jwt_token`, but only opens a database session when
+    the token is not already cached. For routes that need nothing else from
+    the database.
+    """
+    token_hash = hash_token(credentials.credentials)
+    cached = _token_cache.get(token_hash)
+    if cached:
+        return cached
+    async with AsyncSessionLocal() as session:
+        return await _lookup_token(session, token_hash)
 
 
-AuthDependency = Annotated[AdminAccessTokens, Depends(verify_jwt_token)]
+AuthDependency = Annotated[TokenInfo, Depends(verify_jwt_token)]
+CachedAuthDependency = Annotated[TokenInfo, Depends(verify_cached_token)]
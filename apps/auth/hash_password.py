@@ -0,0 +1,19 @@
+"""
+Print the argon2 hash to store for an admin in credentials.json.
+
+Usage:
+    python -m apps.auth.hash_password
+
+credentials.json maps each username to such a hash, e.g.
+    {"admin@example.com": "$argon2id$v=19$m=65536,t=3,p=4$..."}
+"""
+
+from getpass import getpass
+
+from argon2 import PasswordHasher
+
+if __name__ == "__main__":
+    password = getpass("Password: ")
+    if password != getpass("Repeat password: "):
+        raise SystemExit("Passwords do not match")
+    print(PasswordHasher().hash(password))
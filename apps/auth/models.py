@@ -1,26 +1,29 @@
-import uuid
-from datetime import datetime, timedelta, timezone
-
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Index, String, Uuid, text
 from core.database.sqlalchamey.base import AbstractSQLModel
 from core.database.sqlalchamey.fields import TZAwareDateTime
 from core.database.sqlalchamey.mixins import TimestampsMixin
 
 
-def generate_uuid():
-    return str(uuid.uuid4())
-
-
-def get_expiry_datetime():
-    return datetime.now(timezone.utc) + timedelta(days=1)
-
-
 class AdminAccessTokens(AbstractSQLModel, TimestampsMixin):
     __tablename__ = "admin_access_tokens"
+    __table_args__ = (
+        Index(
+            "ix_admin_tokens_token_expiry",
+            "token",
+            unique=True,
+            postgresql_include=["expiry"],
+        ),
+    )
     id = Column(
-        String(36), primary_key=True, default=generate_uuid, unique=True, nullable=False
+        Uuid(as_uuid=False),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+        unique=True,
+        nullable=False,
     )
-    token = Column(String(500), nullable=False, unique=True, index=True)
+    token = Column(String(64), nullable=False)
     expiry = Column(
-        TZAwareDateTime(timezone=True), nullable=False, default=get_expiry_datetime
+        TZAwareDateTime(timezone=True),
+        nullable=False,
+        server_default=text("now() + interval '1 day'"),
     )
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, HTTPException
+import string
+
+from fastapi import APIRouter
+from fastapi.exceptions import RequestValidationError
 from fastapi.params import Body
 
-from apps.auth.dependency import AuthDependency
+from apps.auth.dependency import AuthDependency, CachedAuthDependency
 from apps.auth.service import AuthServiceDependency
 
 
@@ -9,15 +12,26 @@ router = APIRouter(
     prefix="/auth",
 )
 
+USERNAME_CHARS = frozenset(string.ascii_letters + string.digits + "@_.-")
+
 
 @router.post("/login")
 async def login(
     auth_service: AuthServiceDependency,
-    username: str = Body(
-        ..., min_length=5, max_length=100, regex=r"^[A-Za-z0-9@_.-]+$"
-    ),
+    username: str = Body(..., min_length=5, max_length=100),
     password: str = Body(..., min_length=5, max_length=100),
 ):
+    if not USERNAME_CHARS.issuperset(username):
+        raise RequestValidationError(
+            [
+                {
+                    "type": "string_pattern_mismatch",
+                    "loc": ("body", "username"),
+                    "msg": "Username may only contain letters, digits and @_.-",
+                    "input": username,
+                }
+            ]
+        )
     token = await auth_service.authenticate_and_create_jwt(username, password)
     return {"access_token": token}
 
@@ -29,5 +43,5 @@ async def logout(auth_service: AuthServiceDependency, auth: AuthDependency):
 
 
 @router.get("/auth")
-async def protected_route(auth_service: AuthDependency):
+async def protected_route(auth: CachedAuthDependency):
     return {"message": "This is a protected route"}
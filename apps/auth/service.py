@@ -1,16 +1,57 @@
+import base64
+import hashlib
 import json
+import logging
+import os
 from typing import Annotated
-from fastapi.params import Depends
-import jwt
-from datetime import datetime, timedelta, timezone
-import secrets
-from sqlalchemy import select
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import delete, func, insert, select
 
+from apps.auth import _token_cache
 from apps.auth.models import AdminAccessTokens
 from core.database.sqlalchamey.core import SessionDep
 from core.exception.request import InvalidRequestException
 from core.fastapi.dependency.service_dependency import AbstractService
-from apps.settings import settings
+
+logger = logging.getLogger(__name__)
+
+CREDENTIALS_FILE = "credentials.json"
+
+_CREDENTIALS = {"mtime": 0.0, "data": {}}
+
+_PASSWORD_HASHER = PasswordHasher()
+
+# Verified in place of unknown usernames so they take as long as a wrong
+# password.
+_DUMMY_HASH = _PASSWORD_HASHER.hash("not-a-real-password")
+
+
+def hash_token(token: str) -> str:
+    """Digest of an access token as stored in `AdminAccessTokens.token`."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _load_credentials() -> dict:
+    """
+    Return the admin credentials (username -> argon2 hash), re-reading the
+    file only when it changes.
+    """
+    mtime = os.stat(CREDENTIALS_FILE).st_mtime
+    if mtime != _CREDENTIALS["mtime"]:
+        with open(CREDENTIALS_FILE) as f:
+            _CREDENTIALS["data"] = json.load(f)
+        _CREDENTIALS["mtime"] = mtime
+        for username, stored in _CREDENTIALS["data"].items():
+            if not isinstance(stored, str) or not stored.startswith("$argon2"):
+                logger.error(
+                    "%s: entry for %r is not an argon2 hash, so it cannot log in; "
+                    "generate one with `python -m apps.auth.hash_password`",
+                    CREDENTIALS_FILE,
+                    username,
+                )
+    return _CREDENTIALS["data"]
 
 
 class AuthService(AbstractService):
@@ -23,34 +64,68 @@ class AuthService(AbstractService):
         self.session = session
 
     def password_authenticate(self, username: str, password: str):
-        with open("credentials.json") as f:
-            credentials = json.load(f)
-        if username in credentials and credentials[username] == password:
-            return True
-        return False
+        stored = _load_credentials().get(username)
+        try:
+            _PASSWORD_HASHER.verify(stored or _DUMMY_HASH, password)
+        except InvalidHashError:
+            logger.error(
+                "%s: stored credential for %r is not a valid argon2 hash",
+                CREDENTIALS_FILE,
+                username,
+            )
+            return False
+        except VerificationError:
+            return False
+        return stored is not None
 
     async def authenticate_and_create_jwt(self, username: str, password: str):
-        if not self.password_authenticate(username, password):
+        if not await run_in_threadpool(self.password_authenticate, username, password):
             raise InvalidRequestException("unauthorized")
 
-        access_token = secrets.token_urlsafe(32)
-        token = AdminAccessTokens(
-            token=access_token,
+        access_token = (
+            base64.urlsafe_b64encode(os.urandom(32)).rstrip(b"=").decode("ascii")
+        )
+        await self.session.execute(
+            insert(AdminAccessTokens).values(token=hash_token(access_token))
         )
-        self.session.add(token)
         await self.session.commit()
         return access_token
 
-    async def invalidate_jwt(self, token: str):
-        query = await self.session.execute(
-            select(AdminAccessTokens).where(AdminAccessTokens.token == token)
+    async def invalidate_jwt(self, token_hash: str):
+        """
+        Delete the token and evict it from this process's token cache. Other
+        workers keep their cached copy, so the token stays usable there for
+        up to the cache TTL (60s) after logout.
+        """
+        token_entry = await self.session.scalar(
+            select(AdminAccessTokens).where(AdminAccessTokens.token == token_hash)
         )
-        token_entry = query.scalars().first()
         if token_entry:
             await self.session.delete(token_entry)
             await self.session.commit()
+            _token_cache.pop(token_hash)
             return True
+        _token_cache.pop(token_hash)
         return False
 
+    async def purge_expired(self, batch_size: int = 1000) -> int:
+        """Delete expired tokens in batches, returning how many were removed."""
+        purged = 0
+        while True:
+            expired = (
+                select(AdminAccessTokens.id)
+                .where(AdminAccessTokens.expiry < func.now())
+                .limit(batch_size)
+            )
+            result = await self.session.execute(
+                delete(AdminAccessTokens)
+                .where(AdminAccessTokens.id.in_(expired))
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.commit()
+            purged += result.rowcount
+            if result.rowcount < batch_size:
+                return purged
+
 
 AuthServiceDependency = Annotated[AuthService, AuthService.get_dependency()]
@@ -0,0 +1,24 @@
+import asyncio
+import logging
+
+from apps.auth.service import AuthService
+from core.database.sqlalchamey.core import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+PURGE_INTERVAL_SECONDS = 15 * 60
+
+
+async def purge_expired_tokens_periodically(
+    interval: float = PURGE_INTERVAL_SECONDS,
+):
+    """Remove expired admin tokens every `interval` seconds until cancelled."""
+    while True:
+        try:
+            async with AsyncSessionLocal() as session:
+                purged = await AuthService(session=session).purge_expired()
+            if purged:
+                logger.info(f"Purged {purged} expired admin access tokens")
+        except Exception as e:
+            logger.error(f"Failed to purge expired admin access tokens: {str(e)}")
+        await asyncio.sleep(interval)
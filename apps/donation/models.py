@@ -1,5 +1,5 @@
-import uuid
-from sqlalchemy import Column, String, Boolean, Float, ForeignKey
+from sqlalchemy import Column, Index, String, Boolean, Float, ForeignKey, Uuid
+from sqlalchemy import func, literal_column, text
 from sqlalchemy.orm import relationship
 
 from apps.donation.schema import DonationStatus, FormG80SubmissionStatus
@@ -7,15 +7,20 @@ from core.database.sqlalchamey.base import AbstractSQLModel
 from core.database.sqlalchamey.mixins import TimestampsMixin, SoftDeleteMixin
 
 
-def generate_uuid():
-    return str(uuid.uuid4())
-
-
 class Donation(AbstractSQLModel, TimestampsMixin, SoftDeleteMixin):
     __tablename__ = "donations"
+    __table_args__ = (
+        Index("ix_donations_status_created_at", "status", "created_at"),
+        Index("ix_donations_created_at_id", "created_at", "id"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
-        String(36), primary_key=True, default=generate_uuid, unique=True, nullable=False
+        Uuid(as_uuid=False),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+        unique=True,
+        nullable=False,
     )
     order_id = Column(String(50), nullable=False, unique=True, index=True)
     full_name = Column(String(255), nullable=False)
@@ -40,12 +45,20 @@ class Donation(AbstractSQLModel, TimestampsMixin, SoftDeleteMixin):
 
 class FormG80Submission(AbstractSQLModel, TimestampsMixin, SoftDeleteMixin):
     __tablename__ = "form_g80_submissions"
+    __table_args__ = (
+        Index("ix_form_g80_submissions_created_at_id", "created_at", "id"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
-        String(36), primary_key=True, default=generate_uuid, unique=True, nullable=False
+        Uuid(as_uuid=False),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+        unique=True,
+        nullable=False,
     )
     donation_id = Column(
-        String(36), ForeignKey("donations.id"), nullable=False, index=True
+        Uuid(as_uuid=False), ForeignKey("donations.id"), nullable=False, index=True
     )
     pan_number = Column(String(20), nullable=False)
     full_address = Column(String(1000), nullable=False)
@@ -61,3 +74,29 @@ class FormG80Submission(AbstractSQLModel, TimestampsMixin, SoftDeleteMixin):
     )
 
     donation = relationship("Donation", back_populates="g80_certificate")
+
+
+def _search_text(*columns):
+    """Space-separated concatenation of `columns`, rendered with literals only."""
+    text = columns[0]
+    for column in columns[1:]:
+        text = text + literal_column("' '") + column
+    return text
+
+
+# Text matched by the admin listing search. These must stay identical to the
+# expressions behind the ix_*_search_trgm GIN indexes for Postgres to use them.
+DONATION_SEARCH_TEXT = _search_text(
+    Donation.full_name,
+    func.coalesce(Donation.email, literal_column("''")),
+    Donation.contact_number,
+    Donation.order_id,
+)
+FORM_G80_SEARCH_TEXT = _search_text(
+    FormG80Submission.pan_number,
+    FormG80Submission.full_address,
+    FormG80Submission.city,
+    FormG80Submission.state,
+    FormG80Submission.country,
+    FormG80Submission.pin_code,
+)
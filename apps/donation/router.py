@@ -1,22 +1,19 @@
 from datetime import datetime, timedelta, timezone
+from typing import Annotated
+from uuid import UUID
 from fastapi import APIRouter, Body, Request
 
 from apps.auth.dependency import AuthDependency
 from apps.donation.schema import (
     DonationListResponse,
     DonationRequest,
-    DonationStatusResponse,
     Form80SubmissionListResponse,
 )
 from apps.donation.service import DonationServiceDependency
 from apps.payments.models import PhonePePaymentLog, SbiePayPaymentLog
-from apps.payments.schema import PhonePePaymentStatus
 from core.exception.request import InvalidRequestException
-from core.fastapi.response.pagination import (
-    PaginatedResponse,
-    PaginationParams,
-    paginated_response,
-)
+from core.fastapi.dependency.json_body import json_body, json_body_openapi
+from core.fastapi.response.pagination import PaginatedResponse, PaginationParams
 from apps.settings import settings
 
 router = APIRouter(
@@ -24,9 +21,9 @@ router = APIRouter(
 )
 
 
-@router.post("/donate")
+@router.post("/donate", openapi_extra=json_body_openapi(DonationRequest))
 async def create_donation_endpoint(
-    donation: DonationRequest,
+    donation: Annotated[DonationRequest, json_body(DonationRequest)],
     donation_service: "DonationServiceDependency",
 ):
     gateway = "sbiepay"
@@ -153,15 +150,14 @@ async def list_donations_endpoint(
     from_datetime: datetime | None = None,
     to_datetime: datetime | None = None,
 ) -> PaginatedResponse[DonationListResponse]:
-    donations = await donation_service.list_donations(
-        status=status,
+    return await donation_service.list_donations(
+        pagination,
+        request=request,
         from_datetime=from_datetime,
         to_datetime=to_datetime,
         search=search,
-        limit=pagination.limit,
-        offset=pagination.offset,
+        status=status,
     )
-    return paginated_response(donations, request=request, schema=DonationListResponse)
 
 
 @router.get("/list_form80_requests")
@@ -175,28 +171,25 @@ async def list_form80_requests_endpoint(
     to_datetime: datetime | None = None,
     status: str | None = None,
 ) -> PaginatedResponse[Form80SubmissionListResponse]:
-    form80_requests = await donation_service.list_form80_requests(
+    return await donation_service.list_form80_requests(
+        pagination,
+        request=request,
         from_datetime=from_datetime,
         to_datetime=to_datetime,
-        status=status,
         search=search,
-        limit=pagination.limit,
-        offset=pagination.offset,
-    )
-    return paginated_response(
-        form80_requests, request=request, schema=Form80SubmissionListResponse
+        status=status,
     )
 
 
 @router.post("/submit_form80/{form80_submission_id}")
 async def update_form80_status_endpoint(
-    form80_submission_id: str,
+    form80_submission_id: UUID,
     donation_service: "DonationServiceDependency",
     auth: "AuthDependency",
     status: dict = Body(...),
 ):
     form80_submission = await donation_service.update_formg80_status(
-        submission_id=form80_submission_id, new_status=status["status"]
+        submission_id=str(form80_submission_id), new_status=status["status"]
     )
     return form80_submission
 
@@ -205,11 +198,12 @@ async def update_form80_status_endpoint(
 async def get_donation_details_endpoint(
     donation_service: "DonationServiceDependency",
     auth: "AuthDependency",
-    donation_id: str,
+    donation_id: UUID,
 ):
     """Get detailed donation information (admin only)"""
+    # Malformed ids are rejected with a 422 instead of reaching the uuid column
     donation, payment = await donation_service.get_donation_details(
-        donation_id=donation_id
+        donation_id=str(donation_id)
     )
     if not donation:
         return {"error": "Donation not found"}, 404
@@ -1,8 +1,7 @@
 from datetime import datetime
 from typing import Annotated
-from pydantic import BaseModel, Field, StringConstraints, field_validator
+from pydantic import BaseModel, EmailStr, StringConstraints, field_validator
 from enum import Enum as PyEnum
-from pydantic.networks import validate_email
 
 
 class DonationStatus(PyEnum):
@@ -16,50 +15,58 @@ class FormG80SubmissionStatus(PyEnum):
     GIVEN = "given"
 
 
+# Patterns stay plain strings: pydantic-core compiles them once with its Rust
+# regex engine when the models are built. Passing a compiled `re.Pattern`
+# would switch validation to the slower python-re engine.
+PAN_PATTERN = r"^[A-Za-z0-9]+$"
+ADDRESS_PATTERN = r"^[a-zA-Z0-9\s.,'#/-]+$"
+PLACE_PATTERN = r"^[A-Za-z\s-]+$"
+PIN_CODE_PATTERN = r"^[0-9]{6}$"
+FULL_NAME_PATTERN = r"^[A-Za-z][A-Za-z .'-]*[A-Za-z]$"
+CONTACT_NUMBER_PATTERN = r"^\+?[0-9]{1,4}[0-9]{5,14}$"
+
+# Deletes every character `str.split()` treats as whitespace (U+3000 is the
+# highest one).
+_STRIP_WHITESPACE = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(0x3001)) if c.isspace())
+)
+
+PlaceName = Annotated[
+    str, StringConstraints(min_length=2, max_length=100, pattern=PLACE_PATTERN)
+]
+
+
 class Form80SubmissionRequest(BaseModel):
     pan_number: Annotated[
-        str, StringConstraints(min_length=10, max_length=10, pattern=r"^[A-Za-z0-9]+$")
+        str, StringConstraints(min_length=10, max_length=10, pattern=PAN_PATTERN)
     ]
     full_address: Annotated[
         str,
-        StringConstraints(
-            min_length=5, max_length=500, pattern=r"^[a-zA-Z0-9\s.,'#/-]+$"
-        ),
-    ]
-    city: Annotated[
-        str, StringConstraints(min_length=2, max_length=100, pattern=r"^[A-Za-z\s-]+$")
-    ]
-    state: Annotated[
-        str, StringConstraints(min_length=2, max_length=100, pattern=r"^[A-Za-z\s-]+$")
-    ]
-    country: Annotated[
-        str, StringConstraints(min_length=2, max_length=100, pattern=r"^[A-Za-z\s-]+$")
+        StringConstraints(min_length=5, max_length=500, pattern=ADDRESS_PATTERN),
     ]
+    city: PlaceName
+    state: PlaceName
+    country: PlaceName
     pin_code: Annotated[
-        str, StringConstraints(min_length=6, max_length=6, pattern=r"^[0-9]{6}$")
+        str, StringConstraints(min_length=6, max_length=6, pattern=PIN_CODE_PATTERN)
     ]
 
-    # Normalize full_address
-    @classmethod
-    def model_validate(cls, data):
-        if "full_address" in data and isinstance(data["full_address"], str):
-            data["full_address"] = " ".join(data["full_address"].split())
-        return super().model_validate(data)
+    @field_validator("full_address", mode="before")
+    def normalize_full_address(cls, value):
+        if isinstance(value, str):
+            return " ".join(value.split())
+        return value
 
 
 class DonationRequest(BaseModel):
     full_name: Annotated[
         str,
-        StringConstraints(
-            min_length=2, max_length=100, pattern=r"^[A-Za-z][A-Za-z .'-]*[A-Za-z]$"
-        ),
+        StringConstraints(min_length=2, max_length=100, pattern=FULL_NAME_PATTERN),
     ]
-    email: str | None = Field(None)
+    email: EmailStr | None = None
     contact_number: Annotated[
         str,
-        StringConstraints(
-            min_length=5, max_length=25, pattern=r"^\+?[0-9]{1,4}[0-9]{5,14}$"
-        ),
+        StringConstraints(min_length=5, max_length=25, pattern=CONTACT_NUMBER_PATTERN),
     ]
     amount: float
     need_g80_certificate: bool
@@ -67,17 +74,15 @@ class DonationRequest(BaseModel):
     form_g80: Form80SubmissionRequest | None = None
 
     @field_validator("email", mode="before")
-    def validate_email(cls, value):
-        if value:
-            _, value = validate_email(value)
-        return value
+    def blank_email_as_none(cls, value):
+        # The email is optional; forms submit an empty string when it is left out.
+        return value or None
 
     @field_validator("contact_number", mode="before")
     def preprocess_contact_number(cls, value):
         if not isinstance(value, str):
             raise ValueError("Contact number must be a string")
-        cleaned = "".join(value.split()).strip()
-        return cleaned
+        return value.translate(_STRIP_WHITESPACE)
 
     @field_validator("amount", mode="after")
     def validate_amount(cls, value):
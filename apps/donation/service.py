@@ -1,27 +1,57 @@
 import base64
 from datetime import datetime
+from functools import lru_cache
 import hashlib
-import json
-from sqlalchemy import distinct, func, select
+import os
+from sqlalchemy import Select, func, select, tuple_
 from typing_extensions import Annotated
-from fastapi.params import Depends
-from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from fastapi import Request
 from sqlalchemy.orm import joinedload
 
 from apps.payments.models import PhonePePaymentLog, SbiePayPaymentLog
 from apps.payments.schema import PhonePePaymentStatus, SbiePayPaymentStatus
 from apps.payments.service import PaymentServiceDependency
 from core.database.sqlalchamey.core import SessionDep
-from core.exception.request import InvalidRequestException
 from core.fastapi.dependency.service_dependency import AbstractService
+from core.fastapi.response.pagination import (
+    PaginatedResponse,
+    PaginationParams,
+    paginate_query,
+)
 from apps.donation.schema import (
+    DonationListResponse,
     DonationRequest,
     DonationStatus,
+    Form80SubmissionListResponse,
     FormG80SubmissionStatus,
 )
-from apps.donation.models import Donation, FormG80Submission
+from apps.donation.models import (
+    DONATION_SEARCH_TEXT,
+    FORM_G80_SEARCH_TEXT,
+    Donation,
+    FormG80Submission,
+)
 from apps.settings import settings
 
+_STATUS_COMPLETED = DonationStatus.COMPLETED.value
+_STATUS_PENDING = DonationStatus.PENDING.value
+_FORM_G80_PENDING = FormG80SubmissionStatus.PENDING.value
+
+
+@lru_cache(maxsize=2)
+def _get_aesgcm(secret_key: str) -> AESGCM:
+    """AES-256-GCM keyed by the SHA-256 of the secret key, derived once per key."""
+    return AESGCM(hashlib.sha256(secret_key.encode()).digest())
+
+
+def _encrypt_payload(payload: bytes) -> str:
+    """Encrypt with a random 96-bit nonce; returns urlsafe b64 of nonce + ciphertext."""
+    nonce = os.urandom(12)
+    return base64.urlsafe_b64encode(
+        nonce + _get_aesgcm(settings.SECRET_KEY).encrypt(nonce, payload, None)
+    ).decode()
+
 
 class DonationService(AbstractService):
 
@@ -38,26 +68,9 @@ class DonationService(AbstractService):
         self, donation_request: DonationRequest
     ) -> dict:
         """Submit donation using SBI ePay payment gateway"""
-        donation = await self.create_donation(
-            full_name=donation_request.full_name,
-            email=donation_request.email,
-            contact_number=donation_request.contact_number,
-            amount=donation_request.amount,
-            need_g80_certificate=donation_request.need_g80_certificate,
-            confirmed_terms=donation_request.confirmed_terms,
-            payment_provider="sbiepay",
-        )
+        donation = self.add_donation(donation_request, payment_provider="sbiepay")
+        await self.session.commit()
 
-        if donation.need_g80_certificate and donation_request.form_g80:
-            form80 = await self.submit_formg80(
-                donation_id=donation.id,
-                pan_number=donation_request.form_g80.pan_number,
-                full_address=donation_request.form_g80.full_address,
-                city=donation_request.form_g80.city,
-                state=donation_request.form_g80.state,
-                country=donation_request.form_g80.country,
-                pin_code=donation_request.form_g80.pin_code,
-            )
         customer_id = f"{donation.id}"
         # Create SBI ePay payment
         payment_data = await self.payment_service.create_sbiepay_payment(
@@ -78,42 +91,22 @@ class DonationService(AbstractService):
     async def submit_donation_with_phonepe(
         self, donation_request: DonationRequest
     ) -> PhonePePaymentLog:
-        donation = await self.create_donation(
-            full_name=donation_request.full_name,
-            email=donation_request.email,
-            contact_number=donation_request.contact_number,
-            amount=donation_request.amount,
-            need_g80_certificate=donation_request.need_g80_certificate,
-            confirmed_terms=donation_request.confirmed_terms,
-            payment_provider="phonepe",
-        )
-        if donation.need_g80_certificate and donation_request.form_g80:
-            form80 = await self.submit_formg80(
-                donation_id=donation.id,
-                pan_number=donation_request.form_g80.pan_number,
-                full_address=donation_request.form_g80.full_address,
-                city=donation_request.form_g80.city,
-                state=donation_request.form_g80.state,
-                country=donation_request.form_g80.country,
-                pin_code=donation_request.form_g80.pin_code,
-            )
+        donation = self.add_donation(donation_request, payment_provider="phonepe")
         # Encrypt the donation request
-        # Ensure the secret key is a valid 32-byte URL-safe base64-encoded string
-        secret_key = base64.urlsafe_b64encode(
-            hashlib.sha256(settings.SECRET_KEY.encode()).digest()
-        )
-        fernet = Fernet(secret_key)
-        encrypted_data = fernet.encrypt(
-            json.dumps(donation_request.model_dump()).encode()
-        )
+        encrypted_data = _encrypt_payload(donation_request.model_dump_json().encode())
 
-        payment_log = await self.payment_service.create_phonepe_payment(
+        # Commit first, so a PhonePe order never exists without its donation
+        await self.session.commit()
+        response = await self.payment_service.request_phonepe_payment(
             order_id=donation.order_id,
             amount=donation.amount,
-            meta_info={"data": encrypted_data.decode()},
+            meta_info={"data": encrypted_data},
             redirect_url=f"{settings.BACKEND_DOMAIN}/api/payments/phonepe_redirect?order_id={donation.order_id}",
             message="Sukrutha Keralam Donation",
         )
+        payment_log = await self.payment_service.record_phonepe_payment(
+            order_id=donation.order_id, amount=donation.amount, response=response
+        )
         return payment_log
 
     async def submit_donation(
@@ -125,160 +118,129 @@ class DonationService(AbstractService):
         else:
             return await self.submit_donation_with_phonepe(donation_request)
 
-    async def create_donation(
-        self,
-        full_name: str,
-        email: str,
-        contact_number: str,
-        amount: float,
-        need_g80_certificate: bool,
-        confirmed_terms: bool,
-        payment_provider: str = "phonepe",
-    ):
-        order_id = self.payment_service.generate_unique_string(prefix="SK")
+    def add_donation(
+        self, donation_request: DonationRequest, payment_provider: str = "phonepe"
+    ) -> Donation:
+        """
+        Add a pending donation, and its 80G submission when one is requested,
+        to the session without committing.
+
+        Ids come from the database's gen_random_uuid() default and are read
+        back by the INSERT's RETURNING (eager_defaults), so the caller's single
+        commit writes both rows without a refresh.
+        """
         donation = Donation(
-            order_id=order_id,
-            full_name=full_name,
-            email=email,
-            contact_number=contact_number,
-            amount=amount,
-            need_g80_certificate=need_g80_certificate,
-            confirmed_terms=confirmed_terms,
-            status=DonationStatus.PENDING.value,
+            order_id=self.payment_service.generate_unique_string(prefix="SK"),
+            full_name=donation_request.full_name,
+            email=donation_request.email,
+            contact_number=donation_request.contact_number,
+            amount=donation_request.amount,
+            need_g80_certificate=donation_request.need_g80_certificate,
+            confirmed_terms=donation_request.confirmed_terms,
+            status=_STATUS_PENDING,
             payment_provider=payment_provider,
         )
+        form_g80 = donation_request.form_g80
+        if donation.need_g80_certificate and form_g80:
+            donation.g80_certificate = FormG80Submission(
+                pan_number=form_g80.pan_number,
+                full_address=form_g80.full_address,
+                city=form_g80.city,
+                state=form_g80.state,
+                country=form_g80.country,
+                pin_code=form_g80.pin_code,
+                status=_FORM_G80_PENDING,
+            )
         self.session.add(donation)
-        await self.session.commit()
-        await self.session.refresh(donation)
         return donation
 
-    async def submit_formg80(
-        self,
-        donation_id: str,
-        pan_number: str,
-        full_address: str,
-        city: str,
-        state: str,
-        country: str,
-        pin_code: str,
-    ):
-        # existing_submission = await self.session.execute(
-        #     self.session.query(FormG80Submission).filter(
-        #         FormG80Submission.donation_id == donation_id
-        #     )
-        # )
-        # existing_submission = existing_submission.scalar_one_or_none()
-        # if existing_submission:
-        #     raise ValueError("Form G80 submission already exists for this donation.")
-        form_g80_submission = FormG80Submission(
-            donation_id=donation_id,
-            pan_number=pan_number,
-            full_address=full_address,
-            city=city,
-            state=state,
-            country=country,
-            pin_code=pin_code,
-            status=FormG80SubmissionStatus.PENDING.value,
-        )
-        self.session.add(form_g80_submission)
-        await self.session.commit()
-        await self.session.refresh(form_g80_submission)
-        return form_g80_submission
-
-    async def update_formg80_status(self, submission_id: int, new_status: str):
-        form_g80_submission = await self.session.execute(
-            select(FormG80Submission).filter(FormG80Submission.id == submission_id)
-        )
-        form_g80_submission = form_g80_submission.scalar_one_or_none()
+    async def update_formg80_status(self, submission_id: str, new_status: str):
+        # By primary key, so a submission already in the session costs no query
+        form_g80_submission = await self.session.get(FormG80Submission, submission_id)
         if not form_g80_submission:
             raise ValueError("Form G80 submission not found.")
         form_g80_submission.status = new_status
         await self.session.commit()
-        await self.session.refresh(form_g80_submission)
         return form_g80_submission
 
+    def _donation_with_payment_logs(self):
+        """Donation joined with whichever payment log exists for its order."""
+        return (
+            select(Donation, PhonePePaymentLog, SbiePayPaymentLog)
+            .outerjoin(
+                PhonePePaymentLog,
+                PhonePePaymentLog.merchant_order_id == Donation.order_id,
+            )
+            .outerjoin(
+                SbiePayPaymentLog,
+                SbiePayPaymentLog.merchant_order_id == Donation.order_id,
+            )
+        )
+
     async def get_donation_status(self, order_id: str):
-        donation = await self.session.scalar(
-            select(Donation).where(Donation.order_id == order_id)
+        result = await self.session.execute(
+            self._donation_with_payment_logs().where(Donation.order_id == order_id)
         )
+        row = result.one_or_none()
+        if row is None:
+            return None, None
+        donation, phonepe_log, sbiepay_log = row
 
         if donation.payment_provider == "phonepe":
-            phonepe_log = await self.session.scalar(
-                select(PhonePePaymentLog).where(
-                    PhonePePaymentLog.merchant_order_id == order_id
-                )
-            )
-            if donation and phonepe_log:
-                if donation.status != DonationStatus.COMPLETED.value:
+            if phonepe_log:
+                if donation.status != _STATUS_COMPLETED:
                     if (
                         phonepe_log.payment_status
                         == PhonePePaymentStatus.COMPLETED.value
                     ):
-                        donation.status = DonationStatus.COMPLETED.value
+                        donation.status = _STATUS_COMPLETED
                         await self.session.commit()
-                        await self.session.refresh(donation)
                     else:
-                        phonepe_log = await self.payment_service.get_payment_status(
-                            order_id
+                        phonepe_log = (
+                            await self.payment_service.get_phonepe_payment_status(
+                                order_id, donation=donation, payment_log=phonepe_log
+                            )
                         )
-                        await self.session.refresh(donation)
+            return donation, phonepe_log
         elif donation.payment_provider == "sbiepay":
-            sbiepay_log = await self.session.scalar(
-                select(SbiePayPaymentLog).where(
-                    SbiePayPaymentLog.merchant_order_id == order_id
-                )
-            )
-            if donation and sbiepay_log:
-                if donation.status != DonationStatus.COMPLETED.value:
+            if sbiepay_log:
+                if donation.status != _STATUS_COMPLETED:
                     if sbiepay_log.payment_status == SbiePayPaymentStatus.SUCCESS.value:
-                        donation.status = DonationStatus.COMPLETED.value
+                        donation.status = _STATUS_COMPLETED
                         await self.session.commit()
-                        await self.session.refresh(donation)
                     else:
-                        sbiepay_log = await self.payment_service.get_payment_status(
-                            order_id
+                        sbiepay_log = (
+                            await self.payment_service.get_sbiepay_payment_status(
+                                order_id, donation=donation, payment_log=sbiepay_log
+                            )
                         )
-                        await self.session.refresh(donation)
             return donation, sbiepay_log
 
         return donation, None
 
     async def get_donation_details(self, donation_id: str):
         """Get detailed donation information"""
-        donation = await self.session.scalar(
-            select(Donation)
+        result = await self.session.execute(
+            self._donation_with_payment_logs()
             .options(joinedload(Donation.g80_certificate))
             .where(Donation.id == donation_id)
         )
-
-        if not donation:
+        row = result.one_or_none()
+        if row is None:
             return None, None
+        donation, phonepe_log, sbiepay_log = row
 
         if donation.payment_provider == "phonepe":
-
-            # Try to get payment details
-            phonepe_log = await self.session.scalar(
-                select(PhonePePaymentLog).where(
-                    PhonePePaymentLog.merchant_order_id == donation.order_id
-                )
-            )
-
-            if phonepe_log:
-                return donation, phonepe_log
+            return donation, phonepe_log
         elif donation.payment_provider == "sbiepay":
-            sbiepay_log = await self.session.scalar(
-                select(SbiePayPaymentLog).where(
-                    SbiePayPaymentLog.merchant_order_id == donation.order_id
-                )
-            )
-
             return donation, sbiepay_log
+        return donation, None
 
     async def total_donation_amount(
         self, from_datetime: datetime | None = None, to_datetime: datetime | None = None
     ) -> float:
         query = select(func.sum(Donation.amount)).where(
-            Donation.status == DonationStatus.COMPLETED.value
+            Donation.status == _STATUS_COMPLETED
         )
         if from_datetime is not None:
             query = query.where(Donation.created_at >= from_datetime)
@@ -290,8 +252,10 @@ class DonationService(AbstractService):
     async def total_donation_count(
         self, from_datetime: datetime | None = None, to_datetime: datetime | None = None
     ) -> int:
-        query = select(func.count(distinct(Donation.id))).where(
-            Donation.status == DonationStatus.COMPLETED.value
+        query = (
+            select(func.count())
+            .select_from(Donation)
+            .where(Donation.status == _STATUS_COMPLETED)
         )
         if from_datetime is not None:
             query = query.where(Donation.created_at >= from_datetime)
@@ -303,9 +267,14 @@ class DonationService(AbstractService):
     async def total_form80_requests(
         self, from_datetime: datetime | None = None, to_datetime: datetime | None = None
     ) -> int:
-        query = select(func.count(distinct(Donation.id))).where(
-            Donation.status == DonationStatus.COMPLETED.value,
-            Donation.need_g80_certificate == True,
+        query = (
+            select(func.count())
+            .select_from(FormG80Submission)
+            .join(Donation, FormG80Submission.donation_id == Donation.id)
+            .where(
+                Donation.status == _STATUS_COMPLETED,
+                Donation.need_g80_certificate == True,
+            )
         )
 
         if from_datetime is not None:
@@ -316,20 +285,21 @@ class DonationService(AbstractService):
         total = await self.session.scalar(query)
         return total or 0
 
-    async def list_donations(
+    def list_donations_query(
         self,
         from_datetime: datetime | None = None,
         to_datetime: datetime | None = None,
         search: str | None = None,
         status: str | None = None,
-        limit: int | None = None,
-        offset: int | None = None,
-    ):
+        cursor: tuple[datetime, str] | None = None,
+    ) -> Select:
         query = (
             select(Donation)
             .options(joinedload(Donation.g80_certificate))
-            .order_by(Donation.created_at.desc())
+            .order_by(Donation.created_at.desc(), Donation.id.desc())
         )
+        if cursor is not None:
+            query = query.where(tuple_(Donation.created_at, Donation.id) < cursor)
         if from_datetime is not None:
             query = query.where(Donation.created_at >= from_datetime)
         if to_datetime is not None:
@@ -337,39 +307,31 @@ class DonationService(AbstractService):
         if status is not None:
             query = query.where(Donation.status == status)
         if search is not None:
-            query = query.where(
-                Donation.full_name.ilike(f"%{search}%")
-                | Donation.email.ilike(f"%{search}%")
-                | Donation.contact_number.ilike(f"%{search}%")
-                | Donation.order_id.ilike(f"%{search}%")
-            )
-        if offset is not None:
-            query = query.offset(offset)
-        if limit is not None:
-            query = query.limit(limit)
+            query = query.where(DONATION_SEARCH_TEXT.ilike(f"%{search}%"))
+        return query
 
-        donations = await self.session.execute(query)
-        return donations.scalars().all()
-
-    async def list_form80_requests(
+    def list_form80_requests_query(
         self,
         from_datetime: datetime | None = None,
         to_datetime: datetime | None = None,
         search: str | None = None,
         status: str | None = None,
-        limit: int | None = None,
-        offset: int | None = None,
-    ):
+        cursor: tuple[datetime, str] | None = None,
+    ) -> Select:
         query = (
             select(FormG80Submission)
             .options(joinedload(FormG80Submission.donation))
             .where(
-                Donation.status == DonationStatus.COMPLETED.value,
+                Donation.status == _STATUS_COMPLETED,
                 Donation.need_g80_certificate == True,
             )
             .join(Donation, FormG80Submission.donation_id == Donation.id)
-            .order_by(FormG80Submission.created_at.desc())
+            .order_by(FormG80Submission.created_at.desc(), FormG80Submission.id.desc())
         )
+        if cursor is not None:
+            query = query.where(
+                tuple_(FormG80Submission.created_at, FormG80Submission.id) < cursor
+            )
         if from_datetime is not None:
             query = query.where(FormG80Submission.created_at >= from_datetime)
         if to_datetime is not None:
@@ -377,21 +339,56 @@ class DonationService(AbstractService):
         if status is not None:
             query = query.where(FormG80Submission.status == status)
         if search is not None:
-            query = query.where(
-                FormG80Submission.pan_number.ilike(f"%{search}%")
-                | FormG80Submission.full_address.ilike(f"%{search}%")
-                | FormG80Submission.city.ilike(f"%{search}%")
-                | FormG80Submission.state.ilike(f"%{search}%")
-                | FormG80Submission.country.ilike(f"%{search}%")
-                | FormG80Submission.pin_code.ilike(f"%{search}%")
-            )
-        if offset is not None:
-            query = query.offset(offset)
-        if limit is not None:
-            query = query.limit(limit)
+            query = query.where(FORM_G80_SEARCH_TEXT.ilike(f"%{search}%"))
+        return query
+
+    async def list_donations(
+        self,
+        pagination: PaginationParams,
+        request: Request,
+        from_datetime: datetime | None = None,
+        to_datetime: datetime | None = None,
+        search: str | None = None,
+        status: str | None = None,
+    ) -> PaginatedResponse[DonationListResponse]:
+        query = self.list_donations_query(
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            search=search,
+            status=status,
+            cursor=pagination.cursor,
+        )
+        return await paginate_query(
+            query,
+            self.session,
+            pagination,
+            request=request,
+            schema=DonationListResponse,
+        )
 
-        form80_requests = await self.session.execute(query)
-        return form80_requests.scalars().all()
+    async def list_form80_requests(
+        self,
+        pagination: PaginationParams,
+        request: Request,
+        from_datetime: datetime | None = None,
+        to_datetime: datetime | None = None,
+        search: str | None = None,
+        status: str | None = None,
+    ) -> PaginatedResponse[Form80SubmissionListResponse]:
+        query = self.list_form80_requests_query(
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            search=search,
+            status=status,
+            cursor=pagination.cursor,
+        )
+        return await paginate_query(
+            query,
+            self.session,
+            pagination,
+            request=request,
+            schema=Form80SubmissionListResponse,
+        )
 
 
 DonationServiceDependency = Annotated[DonationService, DonationService.get_dependency()]
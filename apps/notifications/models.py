@@ -1,23 +1,24 @@
-import uuid
-from sqlalchemy import Column, String, Text, ForeignKey, JSON
+from sqlalchemy import Column, String, Text, ForeignKey, Uuid, text
 from sqlalchemy.orm import relationship
 
 from core.database.sqlalchamey.base import AbstractSQLModel
+from core.database.sqlalchamey.fields import BinaryJSON
 from core.database.sqlalchamey.mixins import TimestampsMixin, SoftDeleteMixin
 
 
-def generate_uuid():
-    return str(uuid.uuid4())
-
-
 class EmailLog(AbstractSQLModel, TimestampsMixin, SoftDeleteMixin):
     __tablename__ = "email_logs"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
-        String(36), primary_key=True, default=generate_uuid, unique=True, nullable=False
+        Uuid(as_uuid=False),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+        unique=True,
+        nullable=False,
     )
     donation_id = Column(
-        String(36), ForeignKey("donations.id"), nullable=True, index=True
+        Uuid(as_uuid=False), ForeignKey("donations.id"), nullable=True, index=True
     )
     recipient_email = Column(String(255), nullable=False, index=True)
     mail_type = Column(
@@ -30,6 +31,6 @@ class EmailLog(AbstractSQLModel, TimestampsMixin, SoftDeleteMixin):
     )  # pending, sent, failed
     message_id = Column(String(255), nullable=True)  # AWS SES Message ID
     error_message = Column(Text, nullable=True)
-    additional_data = Column(JSON, nullable=True)  # Store additional context/data
+    additional_data = Column(BinaryJSON, nullable=True)  # Store additional context/data
 
     donation = relationship("Donation", backref="email_logs")
@@ -1,12 +1,48 @@
-from typing import Annotated, Dict, Any, Optional
-from fastapi.params import Depends
+import asyncio
+from typing import Annotated, Callable, Coroutine, Dict, Any, List, Optional
+from sqlalchemy import update
+from starlette.concurrency import run_in_threadpool
 
-from core.database.sqlalchamey.core import SessionDep
+from core.database.sqlalchamey.core import AsyncSessionLocal, SessionDep
 from core.fastapi.dependency.service_dependency import AbstractService
 from core.notifications.email import EmailService
 from apps.notifications.models import EmailLog
 from apps.settings import settings
 
+# boto3 clients are thread-safe and slow to build, so share one per process
+_EMAIL_SERVICE = EmailService(
+    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+    aws_region=settings.AWS_REGION,
+    sender_email=settings.SES_SENDER_EMAIL,
+    templates_dir=settings.EMAIL_TEMPLATES_DIR,
+)
+
+# Strong references to in-flight background sends so they aren't garbage
+# collected before they finish.
+_pending_sends: set[asyncio.Task] = set()
+
+
+def run_in_background(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """Run an email coroutine after the request returns, tracked for shutdown."""
+    task = asyncio.create_task(coro)
+    _pending_sends.add(task)
+    task.add_done_callback(_pending_sends.discard)
+    return task
+
+
+async def drain_pending_emails():
+    """Wait for every queued email send to finish (used on shutdown)."""
+    while _pending_sends:
+        await asyncio.gather(*_pending_sends, return_exceptions=True)
+
+
+def _result_values(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an EmailService result to EmailLog column values."""
+    if result["success"]:
+        return {"status": "sent", "message_id": result.get("message_id")}
+    return {"status": "failed", "error_message": result.get("error_message")}
+
 
 class NotificationService(AbstractService):
     DEPENDENCIES = {"session": SessionDep}
@@ -14,14 +50,40 @@ class NotificationService(AbstractService):
     def __init__(self, session: SessionDep, **kwargs):
         super().__init__(**kwargs)
         self.session = session
-        self.email_service = EmailService(
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            aws_region=settings.AWS_REGION,
-            sender_email=settings.SES_SENDER_EMAIL,
-            templates_dir=settings.EMAIL_TEMPLATES_DIR,
+        self.email_service = _EMAIL_SERVICE
+
+    def _enqueue_send(
+        self,
+        email_log: EmailLog,
+        html_body: Optional[str],
+        text_body: Optional[str],
+    ):
+        """Send a committed pending email log in the background"""
+        run_in_background(
+            self._deliver(
+                email_log.id,
+                recipient_email=email_log.recipient_email,
+                subject=email_log.subject,
+                html_body=html_body,
+                text_body=text_body,
+            )
         )
 
+    async def _deliver(self, email_log_id: str, **email):
+        """Call SES off the event loop and record the result on the log"""
+        try:
+            result = await run_in_threadpool(self.email_service.send_email, **email)
+            values = _result_values(result)
+        except Exception as e:
+            values = {"status": "failed", "error_message": str(e)}
+
+        # The request's session is closed by now, so use a fresh one
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(EmailLog).where(EmailLog.id == email_log_id).values(**values)
+            )
+            await session.commit()
+
     async def send_email(
         self,
         recipient_email: str,
@@ -33,7 +95,98 @@ class NotificationService(AbstractService):
         metadata: Optional[Dict[str, Any]] = None,
     ) -> EmailLog:
         """
-        Send email and log the result
+        Log an email as pending and send it in the background
+
+        Args:
+            recipient_email: Recipient email address
+            subject: Email subject
+            html_body: HTML email body
+            text_body: Plain text email body
+            mail_type: Type of email (for categorization)
+            donation_id: Associated donation ID (if applicable)
+            metadata: Additional metadata to store
+
+        Returns:
+            EmailLog: Pending email log record
+        """
+        email_log = EmailLog(
+            donation_id=donation_id,
+            recipient_email=recipient_email,
+            mail_type=mail_type,
+            subject=subject,
+            mail_content=html_body or text_body,
+            status="pending",
+            additional_data=metadata,
+        )
+        self.session.add(email_log)
+        await self.session.commit()
+
+        self._enqueue_send(email_log, html_body, text_body)
+        return email_log
+
+    async def send_template_email(
+        self,
+        recipient_email: str,
+        subject: str,
+        template_name: str,
+        context: Dict[str, Any],
+        mail_type: str = "general",
+        donation_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> EmailLog:
+        """
+        Render a template, log the email as pending and send it in the
+        background
+
+        Args:
+            recipient_email: Recipient email address
+            subject: Email subject
+            template_name: Name of the template file
+            context: Dictionary with template variables
+            mail_type: Type of email (for categorization)
+            donation_id: Associated donation ID (if applicable)
+            metadata: Additional metadata to store
+
+        Returns:
+            EmailLog: Pending email log record, or a failed one if the
+                template could not be rendered
+        """
+        email_log = EmailLog(
+            donation_id=donation_id,
+            recipient_email=recipient_email,
+            mail_type=mail_type,
+            subject=subject,
+            status="pending",
+            additional_data=metadata or {},
+        )
+        try:
+            html_body, text_body = self.email_service.render_template(
+                template_name, context
+            )
+            email_log.mail_content = html_body
+        except Exception as e:
+            email_log.status = "failed"
+            email_log.error_message = str(e)
+
+        self.session.add(email_log)
+        await self.session.commit()
+
+        if email_log.status == "pending":
+            self._enqueue_send(email_log, html_body, text_body)
+        return email_log
+
+    async def send_email_sync(
+        self,
+        recipient_email: str,
+        subject: str,
+        html_body: Optional[str] = None,
+        text_body: Optional[str] = None,
+        mail_type: str = "general",
+        donation_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> EmailLog:
+        """
+        Send email and log the result, waiting for SES before returning
 
         Args:
             recipient_email: Recipient email address
@@ -59,11 +212,11 @@ class NotificationService(AbstractService):
         )
         self.session.add(email_log)
         await self.session.commit()
-        await self.session.refresh(email_log)
 
         try:
             # Send email
-            result = self.email_service.send_email(
+            result = await run_in_threadpool(
+                self.email_service.send_email,
                 recipient_email=recipient_email,
                 subject=subject,
                 html_body=html_body,
@@ -83,10 +236,9 @@ class NotificationService(AbstractService):
             email_log.error_message = str(e)
 
         await self.session.commit()
-        await self.session.refresh(email_log)
         return email_log
 
-    async def send_template_email(
+    async def send_template_email_sync(
         self,
         recipient_email: str,
         subject: str,
@@ -97,7 +249,8 @@ class NotificationService(AbstractService):
         metadata: Optional[Dict[str, Any]] = None,
     ) -> EmailLog:
         """
-        Send email using a template and log the result
+        Send email using a template and log the result, waiting for SES
+        before returning
 
         Args:
             recipient_email: Recipient email address
@@ -122,11 +275,11 @@ class NotificationService(AbstractService):
         )
         self.session.add(email_log)
         await self.session.commit()
-        await self.session.refresh(email_log)
 
         try:
             # Render and send template
-            result = self.email_service.send_template_email(
+            result = await run_in_threadpool(
+                self.email_service.send_template_email,
                 recipient_email=recipient_email,
                 subject=subject,
                 template_name=template_name,
@@ -154,9 +307,90 @@ class NotificationService(AbstractService):
             email_log.error_message = str(e)
 
         await self.session.commit()
-        await self.session.refresh(email_log)
         return email_log
 
+    async def send_template_email_bulk(
+        self,
+        items: List[Dict[str, Any]],
+        template_name: str,
+        subject_fn: Callable[[Dict[str, Any]], str],
+        mail_type: str = "general",
+    ) -> List[EmailLog]:
+        """
+        Send a template email to many recipients and log the results
+
+        All log entries are written with one commit before sending and one
+        after, and the SES calls run concurrently in the threadpool.
+
+        Args:
+            items: One dict per email with `recipient_email` and `context`,
+                and optionally `donation_id` and `metadata`
+            template_name: Name of the template file
+            subject_fn: Builds the subject from an item's context
+            mail_type: Type of email (for categorization)
+
+        Returns:
+            List[EmailLog]: Email log records, in the order of `items`
+        """
+        email_logs = []
+        bodies = []
+        for item in items:
+            email_log = EmailLog(
+                donation_id=item.get("donation_id"),
+                recipient_email=item["recipient_email"],
+                mail_type=mail_type,
+                subject=subject_fn(item["context"]),
+                status="pending",
+                additional_data=item.get("metadata") or {},
+            )
+            try:
+                html_body, text_body = self.email_service.render_template(
+                    template_name, item["context"]
+                )
+                email_log.mail_content = html_body
+                bodies.append((html_body, text_body))
+            except Exception as e:
+                email_log.status = "failed"
+                email_log.error_message = str(e)
+                bodies.append(None)
+            email_logs.append(email_log)
+
+        self.session.add_all(email_logs)
+        await self.session.commit()
+
+        to_send = [
+            (email_log, body)
+            for email_log, body in zip(email_logs, bodies)
+            if body is not None
+        ]
+        results = await asyncio.gather(
+            *[
+                run_in_threadpool(
+                    self.email_service.send_email,
+                    recipient_email=email_log.recipient_email,
+                    subject=email_log.subject,
+                    html_body=html_body,
+                    text_body=text_body,
+                )
+                for email_log, (html_body, text_body) in to_send
+            ],
+            return_exceptions=True,
+        )
+
+        for (email_log, _), result in zip(to_send, results):
+            if isinstance(result, Exception):
+                email_log.status = "failed"
+                email_log.error_message = str(result)
+            elif result["success"]:
+                email_log.status = "sent"
+                email_log.message_id = result.get("message_id")
+            else:
+                email_log.status = "failed"
+                email_log.error_message = result.get("error_message")
+
+        await self.session.commit()
+        return email_logs
+
     async def send_donation_thank_you_email(
         self, donation_id: str, recipient_email: str, context: Dict[str, Any]
     ) -> EmailLog:
@@ -0,0 +1,52 @@
+import asyncio
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+from cachetools import TTLCache
+
+T = TypeVar("T")
+
+# A terminal gateway answer is stable, so it is reused for an hour. A pending
+# one only for a few seconds, enough to merge the thank-you page's polls.
+TERMINAL_TTL = 60 * 60
+PENDING_TTL = 3
+
+# Responses with their monotonic expiry, and the calls currently in flight so
+# concurrent polls for the same order share one upstream request.
+_cache: TTLCache[Hashable, tuple[Any, float]] = TTLCache(
+    maxsize=10_000, ttl=TERMINAL_TTL
+)
+_in_flight: dict[Hashable, asyncio.Task] = {}
+
+
+def _store(key: Hashable, is_terminal: Callable[[Any], bool], task: asyncio.Task):
+    _in_flight.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    response = task.result()
+    ttl = TERMINAL_TTL if is_terminal(response) else PENDING_TTL
+    _cache[key] = (response, time.monotonic() + ttl)
+
+
+async def memoize(
+    key: Hashable,
+    fetch: Callable[[], Awaitable[T]],
+    is_terminal: Callable[[T], bool],
+) -> T:
+    """Return the cached gateway response for `key`, calling `fetch` on a miss."""
+    entry = _cache.get(key)
+    if entry and entry[1] > time.monotonic():
+        return entry[0]
+
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _in_flight[key] = task
+        task.add_done_callback(partial(_store, key, is_terminal))
+    # Shielded so a cancelled caller doesn't cancel the call others await
+    return await asyncio.shield(task)
+
+
+def discard(key: Hashable) -> None:
+    _cache.pop(key, None)
@@ -0,0 +1,49 @@
+import time
+from datetime import datetime
+from typing import NamedTuple
+
+from cachetools import TTLCache
+
+from apps.payments.schema import TERMINAL_PAYMENT_STATUSES
+
+
+class PaymentStatusInfo(NamedTuple):
+    """Detached snapshot of a payment log's status."""
+
+    order_id: str
+    amount: float
+    payment_status: str
+    created_at: datetime
+    updated_at: datetime
+
+
+# A terminal status never changes, so it is kept for a day. A pending one is
+# kept just long enough to absorb a burst of polls from the thank-you page.
+TERMINAL_TTL = 24 * 60 * 60
+PENDING_TTL = 5
+
+# Snapshots keyed by merchant order id, each with its own epoch expiry.
+_cache: TTLCache[str, tuple[PaymentStatusInfo, float]] = TTLCache(
+    maxsize=10_000, ttl=TERMINAL_TTL
+)
+
+
+def get(order_id: str) -> PaymentStatusInfo | None:
+    """Return the cached snapshot for `order_id` if it has not expired."""
+    entry = _cache.get(order_id)
+    if entry and entry[1] > time.time():
+        return entry[0]
+    return None
+
+
+def put(status: PaymentStatusInfo) -> None:
+    ttl = (
+        TERMINAL_TTL
+        if status.payment_status in TERMINAL_PAYMENT_STATUSES
+        else PENDING_TTL
+    )
+    _cache[status.order_id] = (status, time.time() + ttl)
+
+
+def pop(order_id: str) -> None:
+    _cache.pop(order_id, None)
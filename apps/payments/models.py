@@ -1,24 +1,39 @@
-from sqlalchemy import Column, String, Float, JSON, Text
-import uuid
+from sqlalchemy import Column, Index, String, Float, Text, Uuid, text
 
 from apps.payments.schema import PhonePePaymentStatus, SbiePayPaymentStatus
 from core.database.sqlalchamey.base import AbstractSQLModel
+from core.database.sqlalchamey.fields import BinaryJSON
 from core.database.sqlalchamey.mixins import TimestampsMixin, SoftDeleteMixin
 
 
-def generate_uuid():
-    return str(uuid.uuid4())
-
-
 class SbiePayPaymentLog(AbstractSQLModel, TimestampsMixin, SoftDeleteMixin):
     """Database model to track SBIePay payment transactions"""
 
     __tablename__ = "sbiepay_payment_logs"
+    __table_args__ = (
+        Index(
+            "ix_sbiepay_merchant_order_id_covering",
+            "merchant_order_id",
+            unique=True,
+            postgresql_include=[
+                "payment_status",
+                "amount",
+                "created_at",
+                "updated_at",
+                "is_deleted",
+            ],
+        ),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
-        String(36), primary_key=True, default=generate_uuid, unique=True, nullable=False
+        Uuid(as_uuid=False),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+        unique=True,
+        nullable=False,
     )
-    merchant_order_id = Column(String(128), nullable=False, unique=True, index=True)
+    merchant_order_id = Column(String(128), nullable=False)
     sbiepay_ref_id = Column(String(128), nullable=True, index=True)  # ATRN from SBIePay
     encrypted_trans = Column(Text, nullable=False)
     payment_status = Column(
@@ -31,8 +46,8 @@ class SbiePayPaymentLog(AbstractSQLModel, TimestampsMixin, SoftDeleteMixin):
     amount = Column(Float, nullable=False)
     currency = Column(String(8), nullable=False, default="INR")
 
-    sbiepay_response_data = Column(JSON, nullable=True)  # Raw response data
-    double_verification_data = Column(JSON, nullable=True)  # DV API response
+    sbiepay_response_data = Column(BinaryJSON, nullable=True)  # Raw response data
+    double_verification_data = Column(BinaryJSON, nullable=True)  # DV API response
 
     # Payment gateway details
     pay_mode = Column(String(50), nullable=True)  # NB, CC, DC, etc.
@@ -44,17 +59,40 @@ class SbiePayPaymentLog(AbstractSQLModel, TimestampsMixin, SoftDeleteMixin):
     reason_message = Column(String(500), nullable=True)
     other_details = Column(Text, nullable=True)
 
+    def to_email_context(self) -> dict:
+        """Payment fields shown in the donation thank you email"""
+        return {"payment_mode": self.pay_mode}
+
     def __repr__(self):
         return f"<SbiePayPaymentLog(order_id={self.merchant_order_id}, status={self.payment_status})>"
 
 
 class PhonePePaymentLog(AbstractSQLModel, TimestampsMixin, SoftDeleteMixin):
     __tablename__ = "phonepe_payment_logs"
+    __table_args__ = (
+        Index(
+            "ix_phonepe_merchant_order_id_covering",
+            "merchant_order_id",
+            unique=True,
+            postgresql_include=[
+                "payment_status",
+                "amount",
+                "created_at",
+                "updated_at",
+                "is_deleted",
+            ],
+        ),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
-        String(36), primary_key=True, default=generate_uuid, unique=True, nullable=False
+        Uuid(as_uuid=False),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+        unique=True,
+        nullable=False,
     )
-    merchant_order_id = Column(String(128), nullable=False, unique=True, index=True)
+    merchant_order_id = Column(String(128), nullable=False)
     phonepe_order_id = Column(String(128), nullable=False, index=True)
     redirect_url = Column(String(1024), nullable=True)
     payment_status = Column(
@@ -65,4 +103,12 @@ class PhonePePaymentLog(AbstractSQLModel, TimestampsMixin, SoftDeleteMixin):
     )
     amount = Column(Float, nullable=False)
     currency = Column(String(8), nullable=False, default="INR")
-    phonepe_payment_details = Column(JSON, nullable=True)
+    phonepe_payment_details = Column(BinaryJSON, nullable=True)
+
+    def to_email_context(self) -> dict:
+        """Payment fields shown in the donation thank you email"""
+        details = self.phonepe_payment_details
+        # PhonePe returns a list of payment attempts; older rows hold one dict
+        if isinstance(details, list):
+            details = details[0] if details else None
+        return {"payment_mode": details.get("paymentMode") if details else None}
@@ -1,9 +1,9 @@
 import logging
+from urllib.parse import unquote_plus, urlencode
 from fastapi import APIRouter, Query, Request
-from fastapi.params import Body
 from fastapi.responses import RedirectResponse
+from sqlalchemy.exc import SQLAlchemyError
 
-from apps.donation.service import DonationServiceDependency
 from apps.payments.service import PaymentServiceDependency
 from apps.settings import settings
 from core.exception.request import InvalidRequestException
@@ -14,15 +14,37 @@ router = APIRouter(
 
 logger = logging.getLogger(__name__)
 
+_THANKYOU_URL = f"{settings.FRONTEND_DOMAIN}/thankyou"
+
+
+def _thankyou_redirect(**params: str) -> RedirectResponse:
+    return RedirectResponse(url=f"{_THANKYOU_URL}?{urlencode(params)}", status_code=303)
+
+
+async def _form_field(request: Request, name: str) -> str | None:
+    """
+    Read one field of an urlencoded callback body, stopping at the first
+    match instead of decoding every field into a FormData.
+    """
+    if not request.headers.get("content-type", "").startswith(
+        "application/x-www-form-urlencoded"
+    ):
+        return (await request.form()).get(name)
+
+    for pair in (await request.body()).decode("latin-1").split("&"):
+        key, _, value = pair.partition("=")
+        if unquote_plus(key) == name:
+            return unquote_plus(value)
+    return None
+
 
 @router.get("/phonepe_redirect")
 async def phonepe_redirect(
     payment_service: PaymentServiceDependency,
     order_id: str = Query(...),
 ):
-    payment_log = await payment_service.get_payment_status(order_id)
-    redirect_url = settings.FRONTEND_DOMAIN + "/thankyou?order_id=" + order_id
-    return RedirectResponse(url=redirect_url, status_code=303)
+    await payment_service.get_payment_status_info(order_id)
+    return _thankyou_redirect(order_id=order_id)
 
 
 @router.get("/payment_status/{order_id}")
@@ -30,15 +52,13 @@ async def get_payment_status(
     payment_service: PaymentServiceDependency,
     order_id: str,
 ):
-    payment_log = await payment_service.get_payment_status(order_id)
-    if not payment_log:
-        return {"error": "Payment not found"}, 404
+    status = await payment_service.get_payment_status_info(order_id)
     return {
-        "order_id": payment_log.order_id,
-        "amount": payment_log.amount,
-        "status": payment_log.payment_status,
-        "created_at": payment_log.created_at,
-        "updated_at": payment_log.updated_at,
+        "order_id": status.order_id,
+        "amount": status.amount,
+        "status": status.payment_status,
+        "created_at": status.created_at,
+        "updated_at": status.updated_at,
     }
 
 
@@ -49,9 +69,7 @@ async def sbiepay_success(request: Request, payment_service: PaymentServiceDepen
     Expects encrypted response data in the request body.
     """
     try:
-        form_data = await request.form()
-
-        encrypted_response = form_data.get("encData")
+        encrypted_response = await _form_field(request, "encData")
 
         if not encrypted_response:
             logger.error("No encrypted response received in success callback")
@@ -63,15 +81,13 @@ async def sbiepay_success(request: Request, payment_service: PaymentServiceDepen
         payment_log = await payment_service.handle_sbiepay_response(encrypted_response)
 
         # Redirect to frontend with success status
-        redirect_url = f"{settings.FRONTEND_DOMAIN}/thankyou?order_id={payment_log.merchant_order_id}&status=success"
-        return RedirectResponse(url=redirect_url, status_code=303)
+        return _thankyou_redirect(
+            order_id=payment_log.merchant_order_id, status="success"
+        )
 
     except Exception as e:
         logger.error(f"Error processing SBIePay success callback: {str(e)}")
-        redirect_url = (
-            f"{settings.FRONTEND_DOMAIN}/thankyou?message=Payment processing failed"
-        )
-        return RedirectResponse(url=redirect_url, status_code=303)
+        return _thankyou_redirect(message="Payment processing failed")
 
 
 @router.post("/payment/sbiepay_failure", description="SBIePay Failure Callback")
@@ -81,8 +97,7 @@ async def sbiepay_failure(request: Request, payment_service: PaymentServiceDepen
     Expects encrypted response data in the request body.
     """
     try:
-        form_data = await request.form()
-        encrypted_response = form_data.get("encData")
+        encrypted_response = await _form_field(request, "encData")
 
         logger.info(f"Processing SBIePay failure callback for order")
 
@@ -91,18 +106,15 @@ async def sbiepay_failure(request: Request, payment_service: PaymentServiceDepen
             raise InvalidRequestException("Invalid response format")
 
         payment_log = await payment_service.handle_sbiepay_response(encrypted_response)
-        order_id = payment_log.merchant_order_id
-        redirect_url = (
-            f"{settings.FRONTEND_DOMAIN}/thankyou?order_id={order_id}&status=failed"
+        return _thankyou_redirect(
+            order_id=payment_log.merchant_order_id, status="failed"
         )
-        return RedirectResponse(url=redirect_url, status_code=303)
 
         # Redirect to frontend with failure status
 
     except Exception as e:
         logger.error(f"Error processing SBIePay failure callback: {str(e)}")
-        redirect_url = f"{settings.FRONTEND_DOMAIN}/thankyou?message=Payment failed"
-        return RedirectResponse(url=redirect_url, status_code=303)
+        return _thankyou_redirect(message="Payment failed")
 
 
 @router.post(
@@ -117,10 +129,8 @@ async def sbiepay_pushresponse(
     """
     try:
         # Get form data from the request
-        form_data = await request.form()
-
-        # SBIePay sends encrypted response in 'msg' parameter
-        encrypted_response = form_data.get("pushRespData")
+        # SBIePay sends the encrypted response in 'pushRespData'
+        encrypted_response = await _form_field(request, "pushRespData")
 
         if not encrypted_response:
             logger.error("No encrypted response received in server callback")
@@ -128,13 +138,27 @@ async def sbiepay_pushresponse(
 
         logger.info("Processing SBIePay server-to-server callback")
 
-        # Process the encrypted response
-        payment_log = await payment_service.handle_sbiepay_response(encrypted_response)
+        # Process the encrypted response; the verification below commits both
+        payment_log = await payment_service.handle_sbiepay_response(
+            encrypted_response, commit=False
+        )
 
         # Perform double verification for final status
-        verified_log = await payment_service.verify_sbiepay_transaction(
-            payment_log.merchant_order_id, payment_log.sbiepay_ref_id
-        )
+        try:
+            verified_log = await payment_service.verify_sbiepay_transaction(
+                payment_log.merchant_order_id,
+                payment_log.sbiepay_ref_id,
+                amount=payment_log.amount,
+            )
+        except SQLAlchemyError:
+            # The session is in a failed state, and committing it would only
+            # replace this error with PendingRollbackError
+            raise
+        except Exception:
+            # Keep the push response even when the verification call fails
+            await payment_service.session.commit()
+            payment_service.forget_cached_status(payment_log.merchant_order_id)
+            raise
 
         logger.info(
             f"SBIePay callback processed successfully for order: {verified_log.merchant_order_id}"
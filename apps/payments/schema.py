@@ -12,3 +12,15 @@ class SbiePayPaymentStatus(PyEnum):
     SUCCESS = "success"
     FAILED = "failed"
     EXPIRED = "expired"
+
+
+# Payment log statuses that a later gateway check can no longer change
+TERMINAL_PAYMENT_STATUSES = frozenset(
+    {
+        PhonePePaymentStatus.COMPLETED.value,
+        PhonePePaymentStatus.FAILED.value,
+        SbiePayPaymentStatus.SUCCESS.value,
+        SbiePayPaymentStatus.FAILED.value,
+        SbiePayPaymentStatus.EXPIRED.value,
+    }
+)
@@ -1,26 +1,172 @@
+import asyncio
 from datetime import datetime
-import random
-import string
+from functools import partial
+import secrets
 import logging
-import traceback
 from time import time
 from typing import Annotated, Optional
-from uuid import UUID as PyUUID
-from sqlalchemy import select
+from sqlalchemy import bindparam, lambda_stmt, select, union_all
 
 from apps.donation.models import Donation
 from apps.donation.schema import DonationStatus
+from apps.payments import _gateway_cache, _status_cache
+from apps.payments._status_cache import PaymentStatusInfo
 from apps.payments.models import PhonePePaymentLog, SbiePayPaymentLog
-from apps.payments.schema import PhonePePaymentStatus, SbiePayPaymentStatus
-from apps.notifications.service import NotificationServiceDependency
-from core.database.sqlalchamey.core import SessionDep
+from apps.payments.schema import (
+    TERMINAL_PAYMENT_STATUSES,
+    PhonePePaymentStatus,
+    SbiePayPaymentStatus,
+)
+from apps.notifications.service import (
+    NotificationService,
+    NotificationServiceDependency,
+    run_in_background,
+)
+from core.database.sqlalchamey.core import AsyncSessionLocal, SessionDep
 from core.exception.request import InvalidRequestException
+from core.exception.response import ServerSideException
 from core.fastapi.dependency.service_dependency import AbstractService
-from core.payment.phonepe.client import phonepe_client
+from core.payment.phonepe.client import PhonePePaymentState, phonepe_client
 from core.payment.sbiepay import sbiepay_client
 
 logger = logging.getLogger(__name__)
 
+# Plain status strings, so hot paths skip the Enum attribute lookups
+_PP_COMPLETED = PhonePePaymentStatus.COMPLETED.value
+_PP_FAILED = PhonePePaymentStatus.FAILED.value
+_PP_PENDING = PhonePePaymentStatus.PENDING.value
+_SP_SUCCESS = SbiePayPaymentStatus.SUCCESS.value
+_SP_FAILED = SbiePayPaymentStatus.FAILED.value
+_SP_EXPIRED = SbiePayPaymentStatus.EXPIRED.value
+_SP_PENDING = SbiePayPaymentStatus.PENDING.value
+_DS_COMPLETED = DonationStatus.COMPLETED.value
+_DS_PAYMENT_FAILED = DonationStatus.PAYMENT_FAILED.value
+_DS_PENDING = DonationStatus.PENDING.value
+
+# Gateway answers that will not change on a later status check
+_PHONEPE_TERMINAL_STATES = frozenset(
+    {
+        PhonePePaymentState.COMPLETED,
+        PhonePePaymentState.FAILED,
+        PhonePePaymentState.EXPIRED,
+    }
+)
+_SBIEPAY_TERMINAL_STATUSES = frozenset({"SUCCESS", "FAILED", "FAIL"})
+
+# Gateway answer -> payment log status; anything else is still pending
+_PHONEPE_STATUS_MAP = {
+    PhonePePaymentState.COMPLETED: _PP_COMPLETED,
+    PhonePePaymentState.FAILED: _PP_FAILED,
+}
+_SBIEPAY_STATUS_MAP = {
+    "SUCCESS": _SP_SUCCESS,
+    "FAILED": _SP_FAILED,
+    "FAIL": _SP_FAILED,
+    "EXPIRED": _SP_EXPIRED,
+}
+
+# Payment log status -> donation status; anything else is still pending
+_DONATION_STATUS_MAP = {
+    _PP_COMPLETED: _DS_COMPLETED,
+    _PP_FAILED: _DS_PAYMENT_FAILED,
+    _SP_SUCCESS: _DS_COMPLETED,
+    _SP_FAILED: _DS_PAYMENT_FAILED,
+    _SP_EXPIRED: _DS_PAYMENT_FAILED,
+}
+
+# Thank you email fields that are the same for every donation
+_EMAIL_STATIC_CONTEXT = {
+    "organization_name": "Sukrutha Keralam",
+    "contact_email": "support@sukruthakeralam.org",
+}
+
+# Order lookups built once; run with {"order_id": ...}
+_PHONEPE_LOG_BY_ORDER = lambda_stmt(
+    lambda: select(PhonePePaymentLog).where(
+        PhonePePaymentLog.merchant_order_id == bindparam("order_id")
+    )
+)
+_SBIEPAY_LOG_BY_ORDER = lambda_stmt(
+    lambda: select(SbiePayPaymentLog).where(
+        SbiePayPaymentLog.merchant_order_id == bindparam("order_id")
+    )
+)
+_SBIEPAY_LOG_BY_ORDER_FOR_UPDATE = _SBIEPAY_LOG_BY_ORDER + (
+    lambda stmt: stmt.with_for_update()
+)
+_DONATION_BY_ORDER = lambda_stmt(
+    lambda: select(Donation).where(Donation.order_id == bindparam("order_id"))
+)
+_DONATION_WITH_LOGS_BY_ORDER = lambda_stmt(
+    lambda: select(Donation, PhonePePaymentLog, SbiePayPaymentLog)
+    .outerjoin(
+        PhonePePaymentLog, PhonePePaymentLog.merchant_order_id == Donation.order_id
+    )
+    .outerjoin(
+        SbiePayPaymentLog, SbiePayPaymentLog.merchant_order_id == Donation.order_id
+    )
+    .where(Donation.order_id == bindparam("order_id"))
+)
+_SBIEPAY_LOG_WITH_DONATION_FOR_UPDATE = lambda_stmt(
+    lambda: select(SbiePayPaymentLog, Donation)
+    .outerjoin(Donation, Donation.order_id == SbiePayPaymentLog.merchant_order_id)
+    .where(SbiePayPaymentLog.merchant_order_id == bindparam("order_id"))
+    .with_for_update(of=SbiePayPaymentLog)
+)
+
+
+def _settled_status_columns(log):
+    return select(
+        log.merchant_order_id,
+        log.amount,
+        log.payment_status,
+        log.created_at,
+        log.updated_at,
+    ).where(
+        log.merchant_order_id == bindparam("order_id"),
+        log.payment_status.in_(TERMINAL_PAYMENT_STATUSES),
+    )
+
+
+# Status columns of a settled payment from whichever log table has the order
+_SETTLED_STATUS_BY_ORDER = union_all(
+    _settled_status_columns(PhonePePaymentLog),
+    _settled_status_columns(SbiePayPaymentLog),
+)
+
+
+# Seconds a gateway call may take before the request gives up on it
+_GATEWAY_CREATE_TIMEOUT = 10
+_GATEWAY_STATUS_TIMEOUT = 5
+
+
+async def _call_gateway(seconds: float, call, /, **kwargs):
+    """Await a gateway client call, failing the request once `seconds` pass."""
+    try:
+        async with asyncio.timeout(seconds):
+            return await call(**kwargs)
+    except TimeoutError:
+        logger.warning("%s timed out after %ss", call.__qualname__, seconds)
+        raise ServerSideException(
+            "Gateway timeout", err_code="GATEWAY_TIMEOUT", status_code=504
+        )
+
+
+def _verify_sbiepay(order_id: str, atrn: str, amount: float):
+    return _gateway_cache.memoize(
+        ("sbiepay", order_id, atrn),
+        partial(
+            _call_gateway,
+            _GATEWAY_STATUS_TIMEOUT,
+            sbiepay_client.verify_transaction,
+            atrn=atrn,
+            merchant_order_number=order_id,
+            amount=amount,
+        ),
+        is_terminal=lambda response: response.status == "success"
+        and response.parsed_response.transaction_status in _SBIEPAY_TERMINAL_STATUSES,
+    )
+
 
 class PaymentService(AbstractService):
     DEPENDENCIES = {
@@ -40,10 +186,7 @@ class PaymentService(AbstractService):
 
     def generate_unique_string(self, prefix: str, sep="-") -> str:
         timestamp = int(time())  # current epoch time in seconds
-        rand_suffix = "".join(
-            random.choices(string.ascii_uppercase + string.digits, k=4)
-        )
-        return f"{prefix}{sep}{timestamp}{rand_suffix}"
+        return f"{prefix}{sep}{timestamp}{secrets.token_hex(3).upper()}"
 
     async def create_phonepe_payment(
         self,
@@ -53,81 +196,100 @@ class PaymentService(AbstractService):
         redirect_url: str,
         message: str,
     ):
-        response = await phonepe_client.create_payment(
+        response = await self.request_phonepe_payment(
+            order_id=order_id,
+            amount=amount,
+            meta_info=meta_info,
+            redirect_url=redirect_url,
+            message=message,
+        )
+        return await self.record_phonepe_payment(
+            order_id=order_id, amount=amount, response=response
+        )
+
+    async def request_phonepe_payment(
+        self,
+        order_id: str,
+        amount: float,
+        meta_info: dict,
+        redirect_url: str,
+        message: str,
+    ):
+        """Create the PhonePe order without touching the database session."""
+        return await _call_gateway(
+            _GATEWAY_CREATE_TIMEOUT,
+            phonepe_client.create_payment,
             merchant_order_id=order_id,
             amount=amount,
             meta_info=meta_info,
             redirect_url=redirect_url,
             message=message,
         )
+
+    async def record_phonepe_payment(self, order_id: str, amount: float, response):
+        """Store the payment log for an order created by `request_phonepe_payment`."""
         payment_log = PhonePePaymentLog(
             merchant_order_id=order_id,
             phonepe_order_id=response.order_id,
             redirect_url=response.redirect_url,
-            payment_status=PhonePePaymentStatus.PENDING.value,
+            payment_status=_PP_PENDING,
             amount=amount,
             currency="INR",
         )
         self.session.add(payment_log)
         await self.session.commit()
-        await self.session.refresh(payment_log)
         return payment_log
 
-    async def get_phonepe_payment_status(self, order_id: str):
-        phonepe_payment_log = await self.session.scalar(
-            select(PhonePePaymentLog).where(
-                PhonePePaymentLog.merchant_order_id == order_id
+    async def get_phonepe_payment_status(
+        self,
+        order_id: str,
+        donation: Optional[Donation] = None,
+        payment_log: Optional[PhonePePaymentLog] = None,
+    ):
+        phonepe_payment_log = payment_log
+        if phonepe_payment_log is None:
+            phonepe_payment_log = await self.session.scalar(
+                _PHONEPE_LOG_BY_ORDER, {"order_id": order_id}
             )
-        )
         if not phonepe_payment_log:
             raise InvalidRequestException("Payment information not found")
-
-        response = await phonepe_client.get_order_status(merchant_order_id=order_id)
-        print("phonepe response:", response)
-        if response.state.value == "COMPLETED":
-            phonepe_payment_log.payment_status = PhonePePaymentStatus.COMPLETED.value
-            pass
-        elif response.state == "FAILED":
-            phonepe_payment_log.payment_status = PhonePePaymentStatus.FAILED.value
-            pass
-        else:
-            phonepe_payment_log.payment_status = PhonePePaymentStatus.PENDING.value
+        if phonepe_payment_log.payment_status in TERMINAL_PAYMENT_STATUSES:
+            return phonepe_payment_log
+
+        response = await _gateway_cache.memoize(
+            ("phonepe", order_id),
+            partial(
+                _call_gateway,
+                _GATEWAY_STATUS_TIMEOUT,
+                phonepe_client.get_order_status,
+                merchant_order_id=order_id,
+            ),
+            is_terminal=lambda response: response.state in _PHONEPE_TERMINAL_STATES,
+        )
+        logger.debug("phonepe response: %s", response)
+        phonepe_payment_log.payment_status = _PHONEPE_STATUS_MAP.get(
+            response.state, _PP_PENDING
+        )
 
         if response.payment_details:
             phonepe_payment_log.phonepe_payment_details = response.payment_details
 
-        await self.session.commit()
-        await self.session.refresh(phonepe_payment_log)
-
-        donation = await self.session.scalar(
-            select(Donation).where(
-                Donation.order_id == phonepe_payment_log.merchant_order_id
-            )
-        )
-        if donation:
-            previous_status = donation.status
-            donation.status = (
-                DonationStatus.COMPLETED.value
-                if phonepe_payment_log.payment_status
-                == PhonePePaymentStatus.COMPLETED.value
-                else (
-                    DonationStatus.PAYMENT_FAILED.value
-                    if phonepe_payment_log.payment_status
-                    == PhonePePaymentStatus.FAILED.value
-                    else DonationStatus.PENDING.value
-                )
+        if donation is None:
+            donation = await self.session.scalar(
+                _DONATION_BY_ORDER, {"order_id": order_id}
             )
-            await self.session.commit()
-            await self.session.refresh(donation)
+        previous_status = donation.status if donation else None
+        self._set_donation_status(donation, phonepe_payment_log.payment_status)
+        # The log and its donation are written together
+        await self.session.commit()
 
-            # Send email if status changed to completed
-            if (
-                previous_status != DonationStatus.COMPLETED.value
-                and donation.status == DonationStatus.COMPLETED.value
-            ):
-                await self._send_donation_thank_you_email_safe(
-                    donation, phonepe_payment_log
-                )
+        # Send email if status changed to completed
+        if (
+            donation
+            and previous_status != _DS_COMPLETED
+            and donation.status == _DS_COMPLETED
+        ):
+            self._queue_donation_thank_you_email(donation, phonepe_payment_log)
 
         return phonepe_payment_log
 
@@ -148,7 +310,7 @@ class PaymentService(AbstractService):
         payment_log = SbiePayPaymentLog(
             merchant_order_id=order_id,
             encrypted_trans=response.encrypted_trans,
-            payment_status=SbiePayPaymentStatus.PENDING.value,
+            payment_status=_SP_PENDING,
             amount=amount,
             currency="INR",
             customer_id=customer_id,
@@ -156,7 +318,6 @@ class PaymentService(AbstractService):
 
         self.session.add(payment_log)
         await self.session.commit()
-        await self.session.refresh(payment_log)
 
         return {
             "payment_log": payment_log,
@@ -165,35 +326,40 @@ class PaymentService(AbstractService):
         }
 
     async def handle_sbiepay_response(
-        self, encrypted_response: str, order_id: str = None
+        self, encrypted_response: str, order_id: str = None, commit: bool = True
     ):
-        """Handle encrypted response from SBIePay gateway"""
+        """
+        Handle encrypted response from SBIePay gateway. With `commit=False`
+        the changes are only flushed, leaving the transaction (and the row
+        lock) to the caller, which calls `forget_cached_status` once it has
+        committed.
+        """
         # Process the encrypted response
         response_data = await sbiepay_client.handle_payment_response(encrypted_response)
 
         if response_data["status"] == "success":
             parsed_data = response_data["data"]
 
-            # Find the payment log
-            payment_log = await self.session.scalar(
-                select(SbiePayPaymentLog).where(
-                    SbiePayPaymentLog.merchant_order_id
-                    == parsed_data.merchant_order_number
-                )
+            # Find the payment log along with its donation
+            payment_log, donation = await self._sbiepay_log_with_donation(
+                parsed_data.merchant_order_number
             )
 
             if not payment_log:
                 if order_id:
                     # Try with provided order_id
-                    payment_log = await self.session.scalar(
-                        select(SbiePayPaymentLog).where(
-                            SbiePayPaymentLog.merchant_order_id == order_id
-                        )
+                    payment_log, donation = await self._sbiepay_log_with_donation(
+                        order_id
                     )
 
                 if not payment_log:
                     raise InvalidRequestException("Payment log not found")
 
+            # Already settled by the other callback; nothing left to apply
+            if payment_log.payment_status == _SP_SUCCESS:
+                await self._end_write(commit)
+                return payment_log
+
             # Store previous status for email trigger
             previous_status = payment_log.payment_status
 
@@ -208,28 +374,26 @@ class PaymentService(AbstractService):
             payment_log.transaction_date = parsed_data.transaction_date
 
             # Map transaction status to our payment status
-            if parsed_data.transaction_status == "SUCCESS":
-                payment_log.payment_status = SbiePayPaymentStatus.SUCCESS.value
-            elif parsed_data.transaction_status in ["FAILED", "FAIL"]:
-                payment_log.payment_status = SbiePayPaymentStatus.FAILED.value
-            else:
-                payment_log.payment_status = SbiePayPaymentStatus.PENDING.value
-
-            await self.session.commit()
-            await self.session.refresh(payment_log)
+            payment_log.payment_status = _SBIEPAY_STATUS_MAP.get(
+                parsed_data.transaction_status, _SP_PENDING
+            )
 
-            # Update donation status and send email if completed
-            donation = await self._update_donation_status(
-                payment_log.merchant_order_id, payment_log.payment_status
+            self._set_donation_status(donation, payment_log.payment_status)
+            await self._end_write(commit)
+            # A verification cached before this response would roll it back
+            _gateway_cache.discard(
+                ("sbiepay", payment_log.merchant_order_id, payment_log.sbiepay_ref_id)
             )
+            if commit:
+                self.forget_cached_status(payment_log.merchant_order_id)
 
             # Send email if payment just completed
             if (
-                previous_status != SbiePayPaymentStatus.SUCCESS.value
-                and payment_log.payment_status == SbiePayPaymentStatus.SUCCESS.value
+                previous_status != _SP_SUCCESS
+                and payment_log.payment_status == _SP_SUCCESS
                 and donation
             ):
-                await self._send_donation_thank_you_email_safe(donation, payment_log)
+                self._queue_donation_thank_you_email(donation, payment_log)
 
             return payment_log
         else:
@@ -237,27 +401,41 @@ class PaymentService(AbstractService):
                 f"Failed to process payment response: {response_data.get('message')}"
             )
 
-    async def verify_sbiepay_transaction(self, order_id: str, atrn: str = None):
-        """Verify SBIePay transaction using Double Verification API"""
-        payment_log = await self.session.scalar(
-            select(SbiePayPaymentLog).where(
-                SbiePayPaymentLog.merchant_order_id == order_id
+    async def verify_sbiepay_transaction(
+        self,
+        order_id: str,
+        atrn: str = None,
+        donation: Optional[Donation] = None,
+        commit: bool = True,
+        amount: Optional[float] = None,
+    ):
+        """
+        Verify SBIePay transaction using Double Verification API. With
+        `commit=False` the changes are only flushed.
+
+        The gateway is asked first and the payment log is locked only to
+        apply its answer, so polls do not hold the row lock across the call.
+        """
+        if not atrn or amount is None:
+            # Use ATRN and amount from payment log if not provided
+            payment_log = await self.session.scalar(
+                _SBIEPAY_LOG_BY_ORDER, {"order_id": order_id}
             )
-        )
+            if not payment_log:
+                raise InvalidRequestException("Payment information not found")
+            atrn = atrn or payment_log.sbiepay_ref_id
+            amount = payment_log.amount if amount is None else amount
+
+        verification_response = await _verify_sbiepay(order_id, atrn, amount)
+
+        payment_log, donation = await self._locked_sbiepay_log(order_id, donation)
 
         if not payment_log:
             raise InvalidRequestException("Payment information not found")
 
-        # Store previous status for email trigger
+        # Store previous status for email trigger, as read under the lock
         previous_status = payment_log.payment_status
 
-        # Use ATRN from payment log if not provided
-        atrn_to_use = atrn or payment_log.sbiepay_ref_id
-
-        verification_response = await sbiepay_client.verify_transaction(
-            atrn=atrn_to_use, merchant_order_number=order_id, amount=payment_log.amount
-        )
-
         if verification_response.status == "success":
             parsed_data = verification_response.parsed_response
 
@@ -270,90 +448,176 @@ class PaymentService(AbstractService):
             payment_log.pay_mode = parsed_data.pay_mode
 
             # Update payment status based on verification
-            if parsed_data.transaction_status == "SUCCESS":
-                payment_log.payment_status = SbiePayPaymentStatus.SUCCESS.value
-            elif parsed_data.transaction_status in ["FAILED", "FAIL"]:
-                payment_log.payment_status = SbiePayPaymentStatus.FAILED.value
-            else:
-                payment_log.payment_status = SbiePayPaymentStatus.PENDING.value
-
-            await self.session.commit()
-            await self.session.refresh(payment_log)
-
-            # Update donation status and send email if completed
-            donation = await self._update_donation_status(
-                order_id, payment_log.payment_status
+            payment_log.payment_status = _SBIEPAY_STATUS_MAP.get(
+                parsed_data.transaction_status, _SP_PENDING
             )
 
+            self._set_donation_status(donation, payment_log.payment_status)
+            await self._end_write(commit)
+            if commit:
+                self.forget_cached_status(order_id)
+
             # Send email if payment just completed
             if (
-                previous_status != SbiePayPaymentStatus.SUCCESS.value
-                and payment_log.payment_status == SbiePayPaymentStatus.SUCCESS.value
+                previous_status != _SP_SUCCESS
+                and payment_log.payment_status == _SP_SUCCESS
                 and donation
             ):
-                await self._send_donation_thank_you_email_safe(donation, payment_log)
+                self._queue_donation_thank_you_email(donation, payment_log)
+        else:
+            # Nothing to apply, but end the transaction and release the row lock
+            await self._end_write(commit)
+            if commit:
+                # The caller's own flushed changes are committed now as well
+                self.forget_cached_status(order_id)
 
         return payment_log
 
-    async def get_sbiepay_payment_status(self, order_id: str):
+    async def get_sbiepay_payment_status(
+        self,
+        order_id: str,
+        donation: Optional[Donation] = None,
+        payment_log: Optional[SbiePayPaymentLog] = None,
+    ):
         """Get SBIePay payment status"""
-        payment_log = await self.session.scalar(
-            select(SbiePayPaymentLog).where(
-                SbiePayPaymentLog.merchant_order_id == order_id
+        if payment_log is None:
+            payment_log = await self.session.scalar(
+                _SBIEPAY_LOG_BY_ORDER, {"order_id": order_id}
             )
-        )
 
         if not payment_log:
             raise InvalidRequestException("Payment information not found")
 
+        # A settled payment cannot change, so don't ask the gateway again
+        if payment_log.payment_status in TERMINAL_PAYMENT_STATUSES:
+            return payment_log
+
         # Only perform verification if we have an ATRN (payment has been processed)
         if payment_log.sbiepay_ref_id:
-            return await self.verify_sbiepay_transaction(order_id)
+            return await self.verify_sbiepay_transaction(
+                order_id,
+                payment_log.sbiepay_ref_id,
+                donation=donation,
+                amount=payment_log.amount,
+            )
 
         return payment_log
 
     # Unified method for getting payment status (works with both gateways)
     async def get_payment_status(self, order_id: str):
         """Get payment status from either PhonePe or SBIePay based on what's available"""
-        # First check donation to know which provider
-        donation = await self.session.scalar(
-            select(Donation).where(Donation.order_id == order_id)
-        )
-        if not donation:
+        # The donation and both payment logs come back in one round trip
+        row = (
+            await self.session.execute(
+                _DONATION_WITH_LOGS_BY_ORDER, {"order_id": order_id}
+            )
+        ).one_or_none()
+        if row is None:
             raise InvalidRequestException("Donation details not found")
+        donation, phonepe_log, sbiepay_log = row
 
-        if donation.payment_provider == "phonepe":
-            return await self.get_phonepe_payment_status(order_id)
-        elif donation.payment_provider == "sbiepay":
-            return await self.get_sbiepay_payment_status(order_id)
+        if donation.payment_provider == "phonepe" and phonepe_log:
+            return await self.get_phonepe_payment_status(
+                order_id, donation=donation, payment_log=phonepe_log
+            )
+        elif donation.payment_provider == "sbiepay" and sbiepay_log:
+            return await self.get_sbiepay_payment_status(
+                order_id, donation=donation, payment_log=sbiepay_log
+            )
         raise InvalidRequestException("Payment information not found")
 
-    async def _update_donation_status(
-        self, order_id: str, payment_status: str
-    ) -> Optional[Donation]:
-        """Helper method to update donation status based on payment status"""
-        donation = await self.session.scalar(
-            select(Donation).where(Donation.order_id == order_id)
-        )
+    async def get_payment_status_info(self, order_id: str) -> PaymentStatusInfo:
+        """
+        Read-through cached variant of `get_payment_status` for polling
+        endpoints. Terminal statuses skip the database and the gateway for a
+        day; pending ones for a few seconds.
+        """
+        status = _status_cache.get(order_id)
+        if status is None:
+            status = await self._settled_payment_status(order_id)
+        if status is None:
+            payment_log = await self.get_payment_status(order_id)
+            status = PaymentStatusInfo(
+                order_id=payment_log.merchant_order_id,
+                amount=payment_log.amount,
+                payment_status=payment_log.payment_status,
+                created_at=payment_log.created_at,
+                updated_at=payment_log.updated_at,
+            )
+        _status_cache.put(status)
+        return status
 
-        if donation:
-            if payment_status in [
-                PhonePePaymentStatus.COMPLETED.value,
-                SbiePayPaymentStatus.SUCCESS.value,
-            ]:
-                donation.status = DonationStatus.COMPLETED.value
-            elif payment_status in [
-                PhonePePaymentStatus.FAILED.value,
-                SbiePayPaymentStatus.FAILED.value,
-            ]:
-                donation.status = DonationStatus.PAYMENT_FAILED.value
-            else:
-                donation.status = DonationStatus.PENDING.value
+    async def _settled_payment_status(
+        self, order_id: str
+    ) -> Optional[PaymentStatusInfo]:
+        """
+        Status columns of a settled payment, read as a plain row from either
+        log table. Returns None when the payment is missing or still open.
+        """
+        row = (
+            await self.session.execute(_SETTLED_STATUS_BY_ORDER, {"order_id": order_id})
+        ).first()
+        return PaymentStatusInfo(*row) if row else None
 
+    def forget_cached_status(self, order_id: str) -> None:
+        """
+        Drop the cached polling status of an order. Call only after the
+        change is committed, or a concurrent poll can cache the old row again.
+        """
+        _status_cache.pop(order_id)
+
+    async def _end_write(self, commit: bool) -> None:
+        """Commit, or just flush when the caller owns the transaction"""
+        if commit:
             await self.session.commit()
-            await self.session.refresh(donation)
+        else:
+            await self.session.flush()
+
+    async def _locked_sbiepay_log(
+        self, order_id: str, donation: Optional[Donation]
+    ) -> tuple[Optional[SbiePayPaymentLog], Optional[Donation]]:
+        if donation is None:
+            return await self._sbiepay_log_with_donation(order_id)
+        payment_log = await self.session.scalar(
+            _SBIEPAY_LOG_BY_ORDER_FOR_UPDATE,
+            {"order_id": order_id},
+            execution_options={"populate_existing": True},
+        )
+        return payment_log, donation
+
+    async def _sbiepay_log_with_donation(
+        self, order_id: str
+    ) -> tuple[Optional[SbiePayPaymentLog], Optional[Donation]]:
+        """
+        SBIePay payment log and its donation, loaded in one query. The log row
+        is locked until the caller commits, so the browser redirect and the
+        server push for the same order are applied one after the other.
+        """
+        row = (
+            await self.session.execute(
+                _SBIEPAY_LOG_WITH_DONATION_FOR_UPDATE,
+                {"order_id": order_id},
+                execution_options={"populate_existing": True},
+            )
+        ).one_or_none()
+        return row if row is not None else (None, None)
 
-        return donation
+    def _set_donation_status(
+        self, donation: Optional[Donation], payment_status: str
+    ) -> None:
+        """Mirror the payment status on the donation; the caller commits"""
+        if donation is not None:
+            donation.status = _DONATION_STATUS_MAP.get(payment_status, _DS_PENDING)
+
+    def _queue_donation_thank_you_email(self, donation: Donation, payment_log):
+        """
+        Send the thank you email after the gateway callback has returned.
+        The request's session is closed by then, so the send runs on its own.
+        """
+        if donation.email:
+            run_in_background(
+                _send_donation_thank_you_email_detached(donation, payment_log)
+            )
 
     async def _send_donation_thank_you_email_safe(
         self, donation: Donation, payment_log
@@ -370,26 +634,17 @@ class PaymentService(AbstractService):
             if donation.email:
                 await self._send_donation_thank_you_email(donation, payment_log)
                 logger.info(
-                    f"Thank you email sent successfully for donation: {donation.id}, order: {donation.order_id}"
+                    f"Thank you email queued for donation: {donation.id}, order: {donation.order_id}"
                 )
-        except Exception as e:
+        except Exception:
             # Log the error but don't raise it
-            # This ensures payment processing continues even if email fails
-            logger.error(
-                f"Failed to send thank you email for donation {donation.id}, "
-                f"order {donation.order_id}: {str(e)}"
+            # This ensures payment processing continues even if email fails.
+            # The email log is already marked failed by the notification service.
+            logger.exception(
+                "Failed to send thank you email for donation %s, order %s",
+                donation.id,
+                donation.order_id,
             )
-            logger.error(f"Email error traceback:\n{traceback.format_exc()}")
-
-            # Optionally, try to log the email failure to database
-            try:
-                # The email log is already created by notification service
-                # with failed status, so we don't need to do anything else
-                pass
-            except Exception as log_error:
-                logger.error(
-                    f"Failed to log email error for donation {donation.id}: {str(log_error)}"
-                )
 
     async def _send_donation_thank_you_email(self, donation: Donation, payment_log):
         """
@@ -404,44 +659,19 @@ class PaymentService(AbstractService):
         """
         if not donation.email:
             return
-        # Extract payment mode and details from payment log
-        payment_mode = None
-        payment_details = None
-
-        # Handle PhonePe payment log
-        if isinstance(payment_log, PhonePePaymentLog):
-            if payment_log.phonepe_payment_details:
-                if isinstance(payment_log.phonepe_payment_details, list):
-                    if len(payment_log.phonepe_payment_details) > 0:
-                        payment_details = payment_log.phonepe_payment_details[0]
-                        payment_mode = payment_details.get("paymentMode")
-                elif isinstance(payment_log.phonepe_payment_details, dict):
-                    payment_mode = payment_log.phonepe_payment_details.get(
-                        "paymentMode"
-                    )
-
-        # Handle SBIePay payment log
-        elif isinstance(payment_log, SbiePayPaymentLog):
-            payment_mode = payment_log.pay_mode
-            # You can add more details from SBIePay if needed
-            payment_details = {
-                "paymentMode": payment_log.pay_mode,
-                "bankCode": payment_log.bank_code,
-                "bankReferenceNumber": payment_log.bank_reference_number,
-            }
+        payment_info = payment_log.to_email_context()
 
         # Prepare email context with all donation details
         context = {
+            **_EMAIL_STATIC_CONTEXT,
             "full_name": donation.full_name,
             "order_id": donation.order_id,
             "amount": f"{donation.amount:,.2f}",
             "status": donation.status,
             "donation_date": donation.created_at.strftime("%B %d, %Y at %I:%M %p"),
             "need_g80_certificate": donation.need_g80_certificate,
-            "payment_mode": payment_mode or "Online Payment",
+            "payment_mode": payment_info["payment_mode"] or "Online Payment",
             "year": datetime.now().year,
-            "organization_name": "Sukrutha Keralam",
-            "contact_email": "support@sukruthakeralam.org",
         }
 
         logger.info(
@@ -456,10 +686,9 @@ class PaymentService(AbstractService):
             context=context,
         )
 
-        if email_log.status == "sent":
+        if email_log.status != "failed":
             logger.info(
-                f"Email successfully sent to {donation.email} "
-                f"with message_id: {email_log.message_id}"
+                f"Email to {donation.email} queued with status: {email_log.status}"
             )
         else:
             logger.warning(
@@ -478,54 +707,66 @@ class PaymentService(AbstractService):
             donation_id: Donation ID to retry email for
 
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if the email was queued, False otherwise
         """
         try:
-            # Get donation
-            donation = await self.session.scalar(
-                select(Donation).where(Donation.id == donation_id)
-            )
-            if not donation.email:
-                return True
+            # Get donation with whichever payment log exists for its order
+            row = (
+                await self.session.execute(
+                    select(Donation, PhonePePaymentLog, SbiePayPaymentLog)
+                    .outerjoin(
+                        PhonePePaymentLog,
+                        PhonePePaymentLog.merchant_order_id == Donation.order_id,
+                    )
+                    .outerjoin(
+                        SbiePayPaymentLog,
+                        SbiePayPaymentLog.merchant_order_id == Donation.order_id,
+                    )
+                    .where(Donation.id == donation_id)
+                )
+            ).one_or_none()
 
-            if not donation:
+            if not row:
                 logger.error(f"Donation not found: {donation_id}")
                 return False
 
-            if donation.status != DonationStatus.COMPLETED.value:
+            donation, phonepe_log, sbiepay_log = row
+            if not donation.email:
+                return True
+
+            if donation.status != _DS_COMPLETED:
                 logger.error(
                     f"Cannot send email for non-completed donation: {donation_id}"
                 )
                 return False
 
-            # Get payment log based on provider
+            # Pick the payment log based on provider
             payment_log = None
             if donation.payment_provider == "phonepe":
-                payment_log = await self.session.scalar(
-                    select(PhonePePaymentLog).where(
-                        PhonePePaymentLog.merchant_order_id == donation.order_id
-                    )
-                )
+                payment_log = phonepe_log
             elif donation.payment_provider == "sbiepay":
-                payment_log = await self.session.scalar(
-                    select(SbiePayPaymentLog).where(
-                        SbiePayPaymentLog.merchant_order_id == donation.order_id
-                    )
-                )
+                payment_log = sbiepay_log
 
             if not payment_log:
                 logger.error(f"Payment log not found for donation: {donation_id}")
                 return False
 
-            # Send email
+            # Queue the email; the notification service sends it in the background
             await self._send_donation_thank_you_email(donation, payment_log)
-            logger.info(f"Email retry successful for donation: {donation_id}")
+            logger.info(f"Email retry queued for donation: {donation_id}")
             return True
 
-        except Exception as e:
-            logger.error(f"Email retry failed for donation {donation_id}: {str(e)}")
-            logger.error(f"Retry error traceback:\n{traceback.format_exc()}")
+        except Exception:
+            logger.exception("Email retry failed for donation %s", donation_id)
             return False
 
 
+async def _send_donation_thank_you_email_detached(donation: Donation, payment_log):
+    async with AsyncSessionLocal() as session:
+        service = PaymentService(
+            session=session, notification_service=NotificationService(session=session)
+        )
+        await service._send_donation_thank_you_email_safe(donation, payment_log)
+
+
 PaymentServiceDependency = Annotated[PaymentService, PaymentService.get_dependency()]
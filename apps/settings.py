@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,6 +16,11 @@ class CoreSettings(BaseSettings):
     DATABASE_USER: str
     DATABASE_PASSWORD: str
     DATABASE_NAME: str
+    # Per worker process; keep workers * (pool size + overflow) under the
+    # server's max_connections
+    DATABASE_POOL_SIZE: int = 10
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_RECYCLE_SECONDS: int = 1800
 
     PHONEPE_CLIENT_ID: str
     PHONEPE_CLIENT_SECRET: str
@@ -29,7 +36,7 @@ class CoreSettings(BaseSettings):
     SES_SENDER_EMAIL: str
     EMAIL_TEMPLATES_DIR: str = "templates/emails"
 
-    @property
+    @cached_property
     def cors_origins(self) -> list[str]:
         if isinstance(self.CORS_ORIGINS, str):
             return [
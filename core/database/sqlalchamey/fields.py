@@ -1,10 +1,13 @@
 from datetime import timedelta, timezone
-from sqlalchemy.types import TypeDecorator, DateTime
-from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import JSON, TypeDecorator, DateTime
 
 # Define IST timezone
 IST = timezone(timedelta(hours=5, minutes=30))
 
+# Binary JSON on Postgres (no reparse on read), plain JSON elsewhere
+BinaryJSON = JSON().with_variant(JSONB(), "postgresql")
+
 
 class TZAwareDateTime(TypeDecorator):
     """
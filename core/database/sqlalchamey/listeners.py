@@ -1,7 +1,5 @@
-from datetime import datetime, timezone
-from .mixins import SoftDeleteMixin, TimestampsMixin
+from .mixins import SoftDeleteMixin
 from sqlalchemy import event
-from sqlalchemy.orm import Query
 from sqlalchemy.orm import with_loader_criteria
 
 
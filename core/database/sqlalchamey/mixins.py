@@ -1,7 +1,5 @@
 from datetime import datetime, timezone
-from typing import Optional
-from sqlalchemy import Boolean, Column, DateTime
-from .base import AbstractSQLModel
+from sqlalchemy import Boolean, Column
 from .fields import TZAwareDateTime
 
 
@@ -2,6 +2,7 @@ from core.exception.core import AbstractException
 
 
 class UnauthorizedException(AbstractException):
+    __slots__ = ()
 
     def __init__(
         self, message, err_code="UNAUTHORIZED", status_code=401, *args, **kwargs
@@ -12,6 +13,7 @@ class UnauthorizedException(AbstractException):
 
 
 class ForbiddenException(AbstractException):
+    __slots__ = ()
 
     def __init__(self, message, err_code="FORBIDDEN", status_code=403, *args, **kwargs):
         super().__init__(
@@ -20,6 +22,7 @@ class ForbiddenException(AbstractException):
 
 
 class TokenExpiredException(AbstractException):
+    __slots__ = ()
 
     def __init__(
         self, message, err_code="TOKEN_EXPIRED", status_code=401, *args, **kwargs
@@ -30,6 +33,7 @@ class TokenExpiredException(AbstractException):
 
 
 class TokenInvalidException(AbstractException):
+    __slots__ = ()
 
     def __init__(
         self, message, err_code="TOKEN_INVALID", status_code=401, *args, **kwargs
@@ -40,6 +44,7 @@ class TokenInvalidException(AbstractException):
 
 
 class TokenUpdatedException(AbstractException):
+    __slots__ = ()
 
     def __init__(
         self, message, err_code="TOKEN_UPDATED", status_code=401, *args, **kwargs
@@ -1,4 +1,10 @@
+import orjson
+
+
 class AbstractException(Exception):
+    # Fixed slots so raising one never allocates an instance __dict__
+    __slots__ = ("message", "error_code", "kwargs", "status_code", "_json_bytes")
+
     def __init__(
         self,
         message: str,
@@ -12,6 +18,7 @@ class AbstractException(Exception):
         self.error_code = err_code
         self.kwargs = kwargs
         self.status_code = status_code
+        self._json_bytes = None
 
     def to_json(self):
         return {
@@ -20,5 +27,15 @@ class AbstractException(Exception):
             "error_code": self.error_code,
         }
 
+    @property
+    def json_bytes(self) -> bytes:
+        """`to_json()` serialized once, for handlers that send raw bytes."""
+        if self._json_bytes is None:
+            self._json_bytes = orjson.dumps(
+                self.to_json(),
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        return self._json_bytes
+
     def __str__(self):
         return f"RESPONSE: <{self.__class__.__name__}> {self.message})"
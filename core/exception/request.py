@@ -2,6 +2,8 @@ from core.exception.core import AbstractException
 
 
 class InvalidRequestException(AbstractException):
+    __slots__ = ()
+
     def __init__(
         self, message, err_code="INVALID_REQUEST", status_code=400, *args, **kwargs
     ):
@@ -2,6 +2,7 @@ from core.exception.core import AbstractException
 
 
 class ServerSideException(AbstractException):
+    __slots__ = ()
 
     def __init__(
         self, message, err_code="SERVER_ERROR", status_code=500, *args, **kwargs
@@ -1,7 +1,8 @@
-from contextlib import asynccontextmanager
-import traceback
-import uuid
-from fastapi import Request
+import asyncio
+from contextlib import asynccontextmanager, suppress
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import ORJSONResponse
@@ -19,16 +20,58 @@ from core.fastapi.app.exception_handlers import (
     statement_error_handler,
     validation_exception_handler,
 )
-from core.fastapi.response.response_class import CustomORJSONResponse
 from core.fastapi.loaders.router import autoload_routers
 from core.fastapi.middlewares.process_time_middleware import ProcessingTimeMiddleware
+from core.payment.phonepe.client import phonepe_client
+from apps.auth.tasks import purge_expired_tokens_periodically
+from apps.notifications.service import drain_pending_emails
 from apps.settings import settings
 
 
+# Loggers whose handlers write synchronously: the root logger and the SQL
+# echo log, which does not propagate and writes every statement to a file
+_QUEUED_LOGGERS = ("", "sqlalchemy.engine")
+
+
+def _start_log_listeners() -> list[tuple[logging.Logger, QueueListener]]:
+    """
+    Put the handlers of each queued logger behind a queue, so records are
+    written by a listener thread instead of blocking the event loop.
+    """
+    listeners = []
+    for name in _QUEUED_LOGGERS:
+        target = logging.getLogger(name)
+        if not target.handlers:
+            continue
+        listener = QueueListener(
+            queue.SimpleQueue(), *target.handlers, respect_handler_level=True
+        )
+        target.handlers = [QueueHandler(listener.queue)]
+        listener.start()
+        listeners.append((target, listener))
+    return listeners
+
+
+def _stop_log_listeners(
+    listeners: list[tuple[logging.Logger, QueueListener]],
+) -> None:
+    for target, listener in listeners:
+        listener.stop()
+        target.handlers = list(listener.handlers)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("AVC CORE:: Cooking ...")
+    log_listeners = _start_log_listeners()
+    token_purger = asyncio.create_task(purge_expired_tokens_periodically())
     yield
+    token_purger.cancel()
+    with suppress(asyncio.CancelledError):
+        await token_purger
+    await drain_pending_emails()
+    await phonepe_client.close()
+    _stop_log_listeners(log_listeners)
     print("AVC CORE:: Cooked !")
 
 
@@ -37,7 +80,7 @@ def create_app(
 ):
     app = FastAPI(
         lifespan=lifespan,
-        default_response_class=CustomORJSONResponse,
+        default_response_class=ORJSONResponse,
         docs_url="/docs" if enable_docs else None,
         redoc_url="/redoc" if enable_docs else None,
         openapi_url="/openapi.json" if enable_docs else None,
@@ -2,7 +2,7 @@ import traceback
 import uuid
 from fastapi import HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import ORJSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import ValidationError
 from sqlalchemy.exc import StatementError, IntegrityError
 
@@ -15,7 +15,9 @@ async def abstract_exception_handler(request: Request, exc: AbstractException):
             {"message": exc.detail, "error_code": exc.status_code},
             status_code=exc.status_code,
         )
-    return ORJSONResponse(exc.to_json(), status_code=exc.status_code)
+    return Response(
+        exc.json_bytes, status_code=exc.status_code, media_type="application/json"
+    )
 
 
 async def custom_auth_exception_handler(request: Request, exc: Exception):
@@ -0,0 +1,74 @@
+from typing import Any, Type, TypeVar
+
+from fastapi import Depends, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def json_body(model: Type[M]):
+    """
+    Returns a FastAPI dependency that validates the raw request body as `model`.
+
+    The body bytes go straight to `model.model_validate_json`, so parsing and
+    validation both happen inside pydantic-core without the intermediate dict
+    FastAPI builds for regular body parameters. Validation errors are raised as
+    `RequestValidationError` with a `body` location, matching the response of a
+    regular body parameter.
+
+    :param model: The Pydantic model to validate the body against.
+    :return: A `Depends` object suitable for use in an `Annotated` parameter.
+    """
+
+    async def parse_json_body(request: Request) -> M:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            errors = []
+            for error in e.errors(include_url=False):
+                error["loc"] = ("body", *error["loc"])
+                if error["type"] == "json_invalid":
+                    # The input is the raw body bytes; report it the way
+                    # FastAPI does for malformed JSON.
+                    error["input"] = {}
+                errors.append(error)
+            raise RequestValidationError(errors)
+
+    parse_json_body.__name__ = f"_parse_{model.__name__.lower()}_body"
+    return Depends(parse_json_body)
+
+
+def _inline_refs(node: Any, defs: dict) -> Any:
+    """Replace local `$ref`s with the referenced definitions"""
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if ref is not None:
+            siblings = {k: v for k, v in node.items() if k != "$ref"}
+            return _inline_refs({**defs[ref.rsplit("/", 1)[-1]], **siblings}, defs)
+        return {k: _inline_refs(v, defs) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_inline_refs(item, defs) for item in node]
+    return node
+
+
+def json_body_openapi(model: Type[BaseModel]) -> dict:
+    """
+    Returns `openapi_extra` documenting `model` as the JSON request body.
+
+    FastAPI cannot see a body read by `json_body`, so routes using it pass this
+    to their decorator to keep the body in the OpenAPI schema. Nested models
+    are inlined, since the schema's `$defs` would not resolve inside the
+    OpenAPI document.
+
+    :param model: The Pydantic model the body is validated against.
+    :return: A dict for the route decorator's `openapi_extra` argument.
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_refs(schema, defs)}},
+        }
+    }
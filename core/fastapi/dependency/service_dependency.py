@@ -1,3 +1,4 @@
+from functools import cache
 from typing import Type, TypeVar, Callable, Dict, Any
 from fastapi import Depends
 from inspect import Parameter, Signature
@@ -44,6 +45,7 @@ class AbstractService:
         return cls(**kwargs)
 
     @classmethod
+    @cache
     def get_dependency(cls: Type[T]) -> Callable[..., T]:
         """
         Returns a FastAPI dependency callable for this service.
@@ -55,6 +57,9 @@ class AbstractService:
         The returned callable, when used with `FastAPI.Depends()`, will ensure that
         all declared dependencies are resolved and passed to the service's constructor.
 
+        The result is cached per class, so every caller shares one callable and
+        FastAPI resolves the service once per request.
+
         :return: A callable suitable for use with FastAPI's `Depends()`.
         """
         parameters = []
@@ -1,6 +1,7 @@
 import os
 import importlib.util
 import traceback
+from functools import cache
 from typing import Optional
 from fastapi import APIRouter
 import logging
@@ -12,6 +13,10 @@ def autoload_routers(base_path: str) -> APIRouter:
     """
     Recursively load all routers from the given base path.
 
+    The assembled router is cached per directory, so building the app again
+    in the same process (tests, multiple create_app calls) reuses it instead
+    of re-executing every router.py. Code reloads start a new process.
+
     Args:
         base_path: The base directory path to start looking for routers
 
@@ -21,6 +26,11 @@ def autoload_routers(base_path: str) -> APIRouter:
     Raises:
         FileNotFoundError: If no router.py file is found in the base path
     """
+    return _autoload_routers(os.path.abspath(base_path))
+
+
+@cache
+def _autoload_routers(base_path: str) -> APIRouter:
     # Check if the base router exists
     base_router_path = os.path.join(base_path, "router.py")
     if not os.path.isfile(base_router_path):
@@ -85,23 +95,25 @@ def _include_sub_routers(
         parent_router: The parent router to include sub-routers in
         visited_paths: Set of paths already visited to avoid infinite recursion
     """
-    # Add current directory to visited paths
-    visited_paths.add(os.path.abspath(directory))
-
-    # Get all subdirectories
-    subdirs = [
-        d
-        for d in os.listdir(directory)
-        if os.path.isdir(os.path.join(directory, d)) and not d.startswith("_")
-    ]
+    # Add current directory to visited paths. Paths come from scandir of an
+    # absolute base, so they are already absolute.
+    visited_paths.add(directory)
+
+    # Get all subdirectories. Without following symlinks DirEntry answers
+    # is_dir from the directory listing alone, with no stat call.
+    with os.scandir(directory) as entries:
+        subdir_paths = [
+            entry.path
+            for entry in entries
+            if not entry.name.startswith("_") and entry.is_dir(follow_symlinks=False)
+        ]
 
     # Check each subdirectory for router.py
-    for subdir in subdirs:
-        subdir_path = os.path.join(directory, subdir)
+    for subdir_path in subdir_paths:
         router_file = os.path.join(subdir_path, "router.py")
 
         # Skip if this path was already visited
-        if os.path.abspath(subdir_path) in visited_paths:
+        if subdir_path in visited_paths:
             continue
 
         # If router.py exists, import it and include in parent router
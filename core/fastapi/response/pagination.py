@@ -1,8 +1,15 @@
-from typing import Annotated, Any, Generic, TypeVar, List, Type, Optional, Dict
+import base64
+from datetime import datetime
+from functools import cache
+from typing import Annotated, Any, Generic, TypeVar, List, Type, Optional
 from urllib.parse import urlencode
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, TypeAdapter
 from fastapi import Depends, Query as GetQuery, Request
-from fastapi.encoders import jsonable_encoder
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.exception.request import InvalidRequestException
 
 T = TypeVar("T")
 M = TypeVar("M", bound=BaseModel)
@@ -13,15 +20,41 @@ class _PaginationParams(BaseModel):
 
     offset: int = 0
     limit: int = 10
+    # (created_at, id) of the last row already seen, newest first
+    cursor: Optional[tuple[datetime, str]] = None
+
+
+def encode_cursor(row: Any) -> str:
+    """Opaque token for the keyset position right after `row`"""
+    return base64.urlsafe_b64encode(
+        orjson.dumps({"ts": row.created_at.isoformat(), "id": str(row.id)})
+    ).decode("ascii")
+
+
+def decode_cursor(token: str) -> tuple[datetime, str]:
+    try:
+        data = orjson.loads(base64.urlsafe_b64decode(token))
+        return datetime.fromisoformat(data["ts"]), str(data["id"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidRequestException("Invalid pagination cursor") from e
 
 
 def get_pagination_params(
-    offset: Annotated[int, GetQuery(ge=0)] = 0,
+    offset: Annotated[int, GetQuery(ge=0, deprecated=True)] = 0,
     limit: Annotated[int, GetQuery(ge=1, le=100)] = 10,
+    cursor: Annotated[Optional[str], GetQuery()] = None,
 ) -> _PaginationParams:
+    if cursor:
+        # A cursor already marks the position, so offset does not apply
+        return _PaginationParams(limit=limit + 1, cursor=decode_cursor(cursor))
     return _PaginationParams(offset=offset, limit=limit + 1)
 
 
+@cache
+def _list_adapter(schema: Type[M]) -> TypeAdapter[List[M]]:
+    return TypeAdapter(List[schema])
+
+
 class PaginatedResponse(BaseModel, Generic[M]):
     limit: int
     offset: int
@@ -30,6 +63,21 @@ class PaginatedResponse(BaseModel, Generic[M]):
     items: List[M]
 
 
+def _page_url(request: Request, **replace: Optional[str]) -> str:
+    """
+    The request URL with `replace` swapped into its query string; a None
+    value drops the parameter. Repeated keys such as ?status=a&status=b
+    are kept in order.
+    """
+    items = [
+        (key, value)
+        for key, value in request.query_params.multi_items()
+        if key not in replace
+    ]
+    items.extend((key, value) for key, value in replace.items() if value is not None)
+    return f"{request.url.path}?{urlencode(items)}"
+
+
 def paginated_response(
     result: List[Any], request: Request, schema: Type[M]
 ) -> PaginatedResponse[M]:
@@ -45,32 +93,33 @@ def paginated_response(
         PaginatedResponse object with properly formatted items
     """
     limit = int(request.query_params.get("limit", 10))
-    offset = int(request.query_params.get("offset", 0))
+    cursor = request.query_params.get("cursor")
+    offset = 0 if cursor else int(request.query_params.get("offset", 0))
 
     # Check if we have more items than requested limit
     has_next = len(result) > limit
     paginated_result = result[:limit] if has_next else result
 
+    # Keyset pages only link forward; the offset fallback can still go back
     has_previous = offset > 0
 
     # Prepare next URL if we have more results
     if has_next:
-        query_params = dict(request.query_params)
-        query_params["offset"] = str(offset + limit)
-        next_url = f"{request.url.path}?{urlencode(query_params)}"
+        next_url = _page_url(
+            request, offset=None, cursor=encode_cursor(paginated_result[-1])
+        )
     else:
         next_url = None
 
     if has_previous:
-        query_params = dict(request.query_params)
-        query_params["offset"] = str(max(0, offset - limit))
-        previous_url = f"{request.url.path}?{urlencode(query_params)}"
+        previous_url = _page_url(request, offset=str(max(0, offset - limit)))
     else:
         previous_url = None
 
-    model_dicts = jsonable_encoder(paginated_result)
-
-    validated_items = [schema.model_validate(item_dict) for item_dict in model_dicts]
+    # Validate straight off the ORM attributes in one pass
+    validated_items = _list_adapter(schema).validate_python(
+        paginated_result, from_attributes=True
+    )
 
     return PaginatedResponse[M](
         limit=limit,
@@ -81,4 +130,31 @@ def paginated_response(
     )
 
 
+async def paginate_query(
+    stmt: Select,
+    session: AsyncSession,
+    params: _PaginationParams,
+    request: Request,
+    schema: Type[M],
+) -> PaginatedResponse[M]:
+    """
+    Fetch one page of `stmt` and wrap it in a PaginatedResponse
+
+    The LIMIT (one row past the page, to detect a next page) and the
+    deprecated OFFSET are applied in SQL. Filtering on `params.cursor` is
+    left to the statement's builder, which knows the sort columns.
+
+    Args:
+        stmt: Select returning ORM entities, already filtered and ordered
+        session: Session to run it on
+        params: Resolved pagination parameters
+        request: FastAPI Request object
+        schema: Pydantic model class to convert results into
+    """
+    if params.offset:
+        stmt = stmt.offset(params.offset)
+    rows = (await session.scalars(stmt.limit(params.limit))).all()
+    return paginated_response(rows, request=request, schema=schema)
+
+
 PaginationParams = Annotated[_PaginationParams, Depends(get_pagination_params)]
@@ -1,13 +1,21 @@
-import os
+import re
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 import boto3
 from botocore.exceptions import ClientError
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    TemplateNotFound,
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+
 
 class EmailService:
     """
@@ -46,11 +54,49 @@ class EmailService:
             self.jinja_env = Environment(
                 loader=FileSystemLoader(str(self.templates_dir)),
                 autoescape=True,
+                # Templates ship with the code, so skip the mtime checks and
+                # share compiled bytecode between worker processes
+                auto_reload=False,
+                bytecode_cache=FileSystemBytecodeCache(),
             )
         else:
             self.templates_dir = None
             self.jinja_env = None
 
+        # template name -> (html template, text template or None)
+        self._templates: Dict[str, tuple[Template, Optional[Template]]] = {}
+        if self.jinja_env:
+            self._preload_templates()
+
+    def _preload_templates(self):
+        """Compile every .html template and its .txt counterpart up front"""
+        names = set(self.jinja_env.list_templates())
+        for name in names:
+            if not name.endswith(".html"):
+                continue
+            text_name = name.replace(".html", ".txt")
+            self._templates[name] = (
+                self.jinja_env.get_template(name),
+                self.jinja_env.get_template(text_name) if text_name in names else None,
+            )
+
+    def _get_templates(self, template_name: str) -> tuple[Template, Optional[Template]]:
+        """Load a template and its optional .txt counterpart once"""
+        templates = self._templates.get(template_name)
+        if templates is None:
+            html_template = self.jinja_env.get_template(template_name)
+            try:
+                text_template = self.jinja_env.get_template(
+                    template_name.replace(".html", ".txt")
+                )
+            except TemplateNotFound:
+                text_template = None
+            templates = self._templates[template_name] = (
+                html_template,
+                text_template,
+            )
+        return templates
+
     def render_template(
         self, template_name: str, context: Dict[str, Any]
     ) -> tuple[str, str]:
@@ -68,20 +114,14 @@ class EmailService:
             raise ValueError("Templates directory not configured")
 
         try:
-            # Render HTML template
-            html_template = self.jinja_env.get_template(template_name)
+            html_template, text_template = self._get_templates(template_name)
             html_content = html_template.render(**context)
 
-            # Try to render text version
-            text_template_name = template_name.replace(".html", ".txt")
-            try:
-                text_template = self.jinja_env.get_template(text_template_name)
+            if text_template:
                 text_content = text_template.render(**context)
-            except Exception:
+            else:
                 # Fallback: strip HTML tags for text version
-                import re
-
-                text_content = re.sub(r"<[^>]+>", "", html_content)
+                text_content = HTML_TAG_PATTERN.sub("", html_content)
 
             return html_content, text_content
 
@@ -11,6 +11,9 @@ from apps.settings import settings
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Refresh the auth token this long before it expires
+_TOKEN_REFRESH_SKEW_SECONDS = 30
+
 
 class PhonePePaymentState(str, Enum):
     PENDING = "PENDING"
@@ -44,23 +47,6 @@ class AuthTokenResponse(BaseModel):
     token_type: str = "Bearer"
 
 
-class PaymentFlowConfig(BaseModel):
-    type: str = "PG_CHECKOUT"
-    message: str
-    merchant_urls: Dict[str, str] = Field(..., alias="merchantUrls")
-
-
-class CreatePaymentRequest(BaseModel):
-    merchant_order_id: str = Field(..., alias="merchantOrderId")
-    amount: int
-    expire_after: int = Field(..., alias="expireAfter")
-    meta_info: Optional[Dict[str, Any]] = Field(default_factory=dict, alias="metaInfo")
-    payment_flow: PaymentFlowConfig = Field(..., alias="paymentFlow")
-
-    class Config:
-        populate_by_name = True
-
-
 class CreatePaymentResponse(BaseModel):
     order_id: str = Field(..., alias="orderId")
     state: PhonePePaymentState
@@ -107,9 +93,9 @@ class PhonePeClient:
         timeout: int = 30,
     ):
         if not settings.DEBUG:
-            print(f"Phonepe: Running in Production mode [{settings.DEBUG}]")
+            logger.info("Phonepe: Running in Production mode")
         else:
-            print(f"Phonepe: Running in Sandbox mode [{settings.DEBUG}]")
+            logger.info("Phonepe: Running in Sandbox mode")
         self._endpoints = (
             self._PROD_API_ENDPOINTS
             if not settings.DEBUG
@@ -121,6 +107,7 @@ class PhonePeClient:
         self._timeout = timeout
         self._auth_token: Optional[str] = None
         self._auth_token_expiry: int = 0
+        self._token_lock = asyncio.Lock()
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def __aenter__(self):
@@ -136,13 +123,22 @@ class PhonePeClient:
         """Create aiohttp session with proper timeout"""
         if not self._session or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=self._timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            # Keep connections to PhonePe warm between payments, so each call
+            # skips the TCP and TLS handshakes
+            connector = aiohttp.TCPConnector(
+                limit=50, keepalive_timeout=60, ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
 
     async def _close_session(self) -> None:
         """Close aiohttp session"""
         if self._session and not self._session.closed:
             await self._session.close()
 
+    async def close(self) -> None:
+        """Close the shared session; called on application shutdown"""
+        await self._close_session()
+
     async def _make_request(
         self,
         method: str,
@@ -221,17 +217,22 @@ class PhonePeClient:
             raise PhonePeError(f"Authentication failed: {str(e)}")
 
     def _is_token_valid(self) -> bool:
-        """Check if current auth token is valid"""
+        """Check if current auth token is valid for at least the refresh skew"""
         if not self._auth_token:
             return False
 
-        current_time = int(time.time() * 1000)  # Epoch milliseconds
-        return current_time < self._auth_token_expiry
+        # expires_at is in epoch seconds
+        current_time = int(time.time())
+        return current_time + _TOKEN_REFRESH_SKEW_SECONDS < self._auth_token_expiry
 
     async def _ensure_auth_token(self) -> None:
         """Ensure we have a valid auth token"""
-        if not self._is_token_valid():
-            await self._get_auth_token()
+        if self._is_token_valid():
+            return
+        # Concurrent callers wait for one refresh instead of each fetching
+        async with self._token_lock:
+            if not self._is_token_valid():
+                await self._get_auth_token()
 
     async def create_payment(
         self,
@@ -259,15 +260,18 @@ class PhonePeClient:
         try:
             await self._ensure_auth_token()
 
-            payment_request = CreatePaymentRequest(
-                merchantOrderId=merchant_order_id,
-                amount=amount * 100,
-                expireAfter=expire_after,
-                metaInfo=meta_info or {},
-                paymentFlow=PaymentFlowConfig(
-                    message=message, merchantUrls={"redirectUrl": redirect_url}
-                ),
-            )
+            # PhonePe create-payment (checkout v2) request body
+            payment_request = {
+                "merchantOrderId": merchant_order_id,
+                "amount": round(amount * 100),
+                "expireAfter": expire_after,
+                "metaInfo": meta_info or {},
+                "paymentFlow": {
+                    "type": "PG_CHECKOUT",
+                    "message": message,
+                    "merchantUrls": {"redirectUrl": redirect_url},
+                },
+            }
 
             headers = {
                 "Content-Type": "application/json",
@@ -278,7 +282,7 @@ class PhonePeClient:
                 method="POST",
                 url=self._endpoints["CREATE_PAYMENT"],
                 headers=headers,
-                json_data=payment_request.model_dump(by_alias=True),
+                json_data=payment_request,
             )
 
             payment_response = CreatePaymentResponse(**response_data)
@@ -12,7 +12,6 @@ from Crypto.Cipher import AES
 from .schemas import (
     CreateSbiePayPaymentResponse,
     PaymentRequest,
-    HandleResponse,
     SbiePayResponseData,
     VerifyTransactionResponse,
     DoubleVerificationParsedResponse,
@@ -79,7 +78,6 @@ class SbiePayClient:
                 result = hashlib.sha256(message.encode()).hexdigest()
 
             concatePipe = message
-            print(concatePipe)
             byte_array = concatePipe.encode("UTF-8")
             padded = self._pad(byte_array)
             iv = os.urandom(AES.block_size)
@@ -88,7 +86,6 @@ class SbiePayClient:
             encrypted = cipher.encrypt(padded)
             return base64.b64encode(iv + encrypted).decode("UTF-8")
         except Exception as e:
-            print(e)
             self.logger.error(f"Encryption failed: {e}")
             raise SbiePayError("Encryption failed during payment request creation.")
 
@@ -139,8 +136,7 @@ class SbiePayClient:
             )
 
             encrypted_packet = self._encrypt(transaction_packet)
-            print("encrypted_packet:", encrypted_packet)
-            print("decrypted_packet:", self._decrypt(encrypted_packet))
+            self.logger.debug("encrypted_packet: %s", encrypted_packet)
 
             payment_request = PaymentRequest(
                 EncryptTrans=encrypted_packet,
@@ -0,0 +1,37 @@
+"""phonepe order status index
+
+Revision ID: 2a9c4e7b1f83
+Revises: d71f0b3a9e52
+Create Date: 2026-10-15 14:05:32.640918
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import core
+
+# revision identifiers, used by Alembic.
+revision: str = "2a9c4e7b1f83"
+down_revision: Union[str, Sequence[str], None] = "d71f0b3a9e52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_phonepe_merchant_order_id_status",
+        "phonepe_payment_logs",
+        ["merchant_order_id", "payment_status"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_phonepe_merchant_order_id_status", table_name="phonepe_payment_logs"
+    )
@@ -0,0 +1,59 @@
+"""admin token covering index
+
+Revision ID: 417dac054688
+Revises: 0e3f8118994f
+Create Date: 2026-10-15 10:12:41.503118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import core
+
+# revision identifiers, used by Alembic.
+revision: str = "417dac054688"
+down_revision: Union[str, Sequence[str], None] = "0e3f8118994f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(
+        op.f("ix_admin_access_tokens_token"), table_name="admin_access_tokens"
+    )
+    op.alter_column(
+        "admin_access_tokens",
+        "token",
+        existing_type=sa.VARCHAR(length=500),
+        type_=sa.String(length=64),
+        existing_nullable=False,
+    )
+    op.create_index(
+        "ix_admin_tokens_token_expiry",
+        "admin_access_tokens",
+        ["token"],
+        unique=True,
+        postgresql_include=["expiry"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_admin_tokens_token_expiry", table_name="admin_access_tokens")
+    op.alter_column(
+        "admin_access_tokens",
+        "token",
+        existing_type=sa.String(length=64),
+        type_=sa.VARCHAR(length=500),
+        existing_nullable=False,
+    )
+    op.create_index(
+        op.f("ix_admin_access_tokens_token"),
+        "admin_access_tokens",
+        ["token"],
+        unique=True,
+    )
@@ -0,0 +1,69 @@
+"""native uuid primary keys
+
+Revision ID: 5b8e2f9c7d14
+Revises: 417dac054688
+Create Date: 2026-10-15 11:02:17.284406
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import core
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8e2f9c7d14"
+down_revision: Union[str, Sequence[str], None] = "417dac054688"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, nullable)
+UUID_COLUMNS = [
+    ("admin_access_tokens", "id", False),
+    ("donations", "id", False),
+    ("form_g80_submissions", "id", False),
+    ("form_g80_submissions", "donation_id", False),
+    ("email_logs", "donation_id", True),
+]
+
+# (constraint, table, column)
+DONATION_FOREIGN_KEYS = [
+    ("form_g80_submissions_donation_id_fkey", "form_g80_submissions", "donation_id"),
+    ("email_logs_donation_id_fkey", "email_logs", "donation_id"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, _ in DONATION_FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_="foreignkey")
+    for table, column, nullable in UUID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.String(length=36),
+            type_=sa.Uuid(as_uuid=False),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::uuid",
+        )
+    for name, table, column in DONATION_FOREIGN_KEYS:
+        op.create_foreign_key(name, table, "donations", [column], ["id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in DONATION_FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_="foreignkey")
+    for table, column, nullable in UUID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.Uuid(as_uuid=False),
+            type_=sa.String(length=36),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::text",
+        )
+    for name, table, column in DONATION_FOREIGN_KEYS:
+        op.create_foreign_key(name, table, "donations", [column], ["id"])
@@ -0,0 +1,35 @@
+"""donation status created_at index
+
+Revision ID: 6e1b8d2c5a40
+Revises: 2a9c4e7b1f83
+Create Date: 2026-10-15 14:32:19.208736
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import core
+
+# revision identifiers, used by Alembic.
+revision: str = "6e1b8d2c5a40"
+down_revision: Union[str, Sequence[str], None] = "2a9c4e7b1f83"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_donations_status_created_at",
+        "donations",
+        ["status", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_donations_status_created_at", table_name="donations")
@@ -0,0 +1,36 @@
+"""hash admin access tokens
+
+Revision ID: 8c3d6a1e4f27
+Revises: 5b8e2f9c7d14
+Create Date: 2026-10-15 11:40:53.917245
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import core
+
+# revision identifiers, used by Alembic.
+revision: str = "8c3d6a1e4f27"
+down_revision: Union[str, Sequence[str], None] = "5b8e2f9c7d14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Replace stored plaintext tokens with their hex SHA-256 digest so
+    # existing sessions keep working.
+    op.execute(
+        "UPDATE admin_access_tokens "
+        "SET token = encode(sha256(convert_to(token, 'UTF8')), 'hex')"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Digests cannot be reversed; drop the sessions instead.
+    op.execute("DELETE FROM admin_access_tokens")
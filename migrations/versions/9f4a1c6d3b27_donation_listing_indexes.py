@@ -0,0 +1,62 @@
+"""donation listing indexes
+
+Revision ID: 9f4a1c6d3b27
+Revises: 6e1b8d2c5a40
+Create Date: 2026-10-15 15:20:44.118352
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import core
+
+# revision identifiers, used by Alembic.
+revision: str = "9f4a1c6d3b27"
+down_revision: Union[str, Sequence[str], None] = "6e1b8d2c5a40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_donations_created_at_id",
+        "donations",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_form_g80_submissions_created_at_id",
+        "form_g80_submissions",
+        ["created_at", "id"],
+        unique=False,
+    )
+    # The indexed expressions must match DONATION_SEARCH_TEXT and
+    # FORM_G80_SEARCH_TEXT in apps/donation/models.py.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_donations_search_trgm ON donations USING gin "
+        "((full_name || ' ' || coalesce(email, '') || ' ' || contact_number "
+        "|| ' ' || order_id) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_form_g80_submissions_search_trgm "
+        "ON form_g80_submissions USING gin "
+        "((pan_number || ' ' || full_address || ' ' || city || ' ' || state "
+        "|| ' ' || country || ' ' || pin_code) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_form_g80_submissions_search_trgm", table_name="form_g80_submissions"
+    )
+    op.drop_index("ix_donations_search_trgm", table_name="donations")
+    op.drop_index(
+        "ix_form_g80_submissions_created_at_id", table_name="form_g80_submissions"
+    )
+    op.drop_index("ix_donations_created_at_id", table_name="donations")
@@ -0,0 +1,50 @@
+"""native uuid log ids
+
+Revision ID: b4e7d2a9c815
+Revises: 9f4a1c6d3b27
+Create Date: 2026-10-15 15:58:09.731546
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import core
+
+# revision identifiers, used by Alembic.
+revision: str = "b4e7d2a9c815"
+down_revision: Union[str, Sequence[str], None] = "9f4a1c6d3b27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LOG_TABLES = ["email_logs", "phonepe_payment_logs", "sbiepay_payment_logs"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in LOG_TABLES:
+        op.alter_column(
+            table,
+            "id",
+            existing_type=sa.String(length=36),
+            type_=sa.Uuid(as_uuid=False),
+            existing_nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+            postgresql_using="id::uuid",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in LOG_TABLES:
+        op.alter_column(
+            table,
+            "id",
+            existing_type=sa.Uuid(as_uuid=False),
+            type_=sa.String(length=36),
+            existing_nullable=False,
+            server_default=None,
+            postgresql_using="id::text",
+        )
@@ -0,0 +1,54 @@
+"""jsonb payload columns
+
+Revision ID: c6f3a8d1e925
+Revises: b4e7d2a9c815
+Create Date: 2026-10-15 16:24:41.208317
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+import core
+
+# revision identifiers, used by Alembic.
+revision: str = "c6f3a8d1e925"
+down_revision: Union[str, Sequence[str], None] = "b4e7d2a9c815"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = [
+    ("sbiepay_payment_logs", "sbiepay_response_data"),
+    ("sbiepay_payment_logs", "double_verification_data"),
+    ("phonepe_payment_logs", "phonepe_payment_details"),
+    ("email_logs", "additional_data"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.JSONB(),
+            type_=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::json",
+        )
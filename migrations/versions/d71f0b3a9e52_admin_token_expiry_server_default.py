@@ -0,0 +1,42 @@
+"""admin token expiry server default
+
+Revision ID: d71f0b3a9e52
+Revises: 8c3d6a1e4f27
+Create Date: 2026-10-15 12:18:06.552190
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import core
+
+# revision identifiers, used by Alembic.
+revision: str = "d71f0b3a9e52"
+down_revision: Union[str, Sequence[str], None] = "8c3d6a1e4f27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "admin_access_tokens",
+        "expiry",
+        existing_type=core.database.sqlalchamey.fields.TZAwareDateTime(timezone=True),
+        existing_nullable=False,
+        server_default=sa.text("now() + interval '1 day'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "admin_access_tokens",
+        "expiry",
+        existing_type=core.database.sqlalchamey.fields.TZAwareDateTime(timezone=True),
+        existing_nullable=False,
+        server_default=None,
+    )
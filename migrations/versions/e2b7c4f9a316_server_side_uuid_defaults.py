@@ -0,0 +1,46 @@
+"""server side uuid defaults
+
+Revision ID: e2b7c4f9a316
+Revises: c6f3a8d1e925
+Create Date: 2026-10-15 16:41:12.540183
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import core
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b7c4f9a316"
+down_revision: Union[str, Sequence[str], None] = "c6f3a8d1e925"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ["admin_access_tokens", "donations", "form_g80_submissions"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "id",
+            existing_type=sa.Uuid(as_uuid=False),
+            existing_nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "id",
+            existing_type=sa.Uuid(as_uuid=False),
+            existing_nullable=False,
+            server_default=None,
+        )
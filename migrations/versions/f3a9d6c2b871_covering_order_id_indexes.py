@@ -0,0 +1,79 @@
+"""covering order id indexes
+
+Revision ID: f3a9d6c2b871
+Revises: e2b7c4f9a316
+Create Date: 2026-10-15 17:20:08.316442
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import core
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a9d6c2b871"
+down_revision: Union[str, Sequence[str], None] = "e2b7c4f9a316"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUS_COLUMNS = ["payment_status", "amount", "created_at", "updated_at", "is_deleted"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_sbiepay_merchant_order_id_covering",
+        "sbiepay_payment_logs",
+        ["merchant_order_id"],
+        unique=True,
+        postgresql_include=STATUS_COLUMNS,
+    )
+    op.drop_index(
+        op.f("ix_sbiepay_payment_logs_merchant_order_id"),
+        table_name="sbiepay_payment_logs",
+    )
+    op.create_index(
+        "ix_phonepe_merchant_order_id_covering",
+        "phonepe_payment_logs",
+        ["merchant_order_id"],
+        unique=True,
+        postgresql_include=STATUS_COLUMNS,
+    )
+    op.drop_index(
+        op.f("ix_phonepe_payment_logs_merchant_order_id"),
+        table_name="phonepe_payment_logs",
+    )
+    op.drop_index(
+        "ix_phonepe_merchant_order_id_status", table_name="phonepe_payment_logs"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_phonepe_merchant_order_id_status",
+        "phonepe_payment_logs",
+        ["merchant_order_id", "payment_status"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_phonepe_payment_logs_merchant_order_id"),
+        "phonepe_payment_logs",
+        ["merchant_order_id"],
+        unique=True,
+    )
+    op.drop_index(
+        "ix_phonepe_merchant_order_id_covering", table_name="phonepe_payment_logs"
+    )
+    op.create_index(
+        op.f("ix_sbiepay_payment_logs_merchant_order_id"),
+        "sbiepay_payment_logs",
+        ["merchant_order_id"],
+        unique=True,
+    )
+    op.drop_index(
+        "ix_sbiepay_merchant_order_id_covering", table_name="sbiepay_payment_logs"
+    )
@@ -0,0 +1,176 @@
+"""
+Unit tests for admin authentication
+
+Run with:
+    pytest tests/test_auth.py -v
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from apps.auth import _token_cache
+from apps.auth import service as auth_service_module
+from apps.auth._token_cache import TokenInfo
+from apps.auth.dependency import verify_cached_token, verify_jwt_token
+from apps.auth.service import AuthService, _PASSWORD_HASHER, hash_token
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def credentials_file(tmp_path, monkeypatch):
+    """Point the auth service at a temporary credentials.json"""
+    path = tmp_path / "credentials.json"
+    path.write_text(
+        json.dumps(
+            {
+                "admin@example.com": _PASSWORD_HASHER.hash("correct-password"),
+                "legacy@example.com": "plaintext-password",
+            }
+        )
+    )
+    monkeypatch.setattr(auth_service_module, "CREDENTIALS_FILE", str(path))
+    monkeypatch.setattr(auth_service_module, "_CREDENTIALS", {"mtime": 0.0, "data": {}})
+    return path
+
+
+@pytest.fixture
+def auth_service():
+    return AuthService(session=None)
+
+
+# ============================================================================
+# PASSWORD AUTHENTICATION TESTS
+# ============================================================================
+
+
+class TestPasswordAuthenticate:
+    """Test AuthService.password_authenticate against credentials.json"""
+
+    def test_hashed_entry(self, credentials_file, auth_service):
+        assert auth_service.password_authenticate(
+            "admin@example.com", "correct-password"
+        )
+
+    def test_wrong_password(self, credentials_file, auth_service):
+        assert not auth_service.password_authenticate(
+            "admin@example.com", "wrong-password"
+        )
+
+    def test_unknown_user(self, credentials_file, auth_service):
+        assert not auth_service.password_authenticate(
+            "nobody@example.com", "correct-password"
+        )
+
+    def test_plaintext_entry_is_rejected_and_logged(
+        self, credentials_file, auth_service, caplog
+    ):
+        with caplog.at_level(logging.ERROR, logger="apps.auth.service"):
+            assert not auth_service.password_authenticate(
+                "legacy@example.com", "plaintext-password"
+            )
+
+        messages = [record.getMessage() for record in caplog.records]
+        # Once when the file is loaded, and once for the failed login
+        assert any("not an argon2 hash" in message for message in messages)
+        assert any("not a valid argon2 hash" in message for message in messages)
+        assert not any("admin@example.com" in message for message in messages)
+
+    def test_load_warning_is_logged_once_per_reload(
+        self, credentials_file, auth_service, caplog
+    ):
+        with caplog.at_level(logging.ERROR, logger="apps.auth.service"):
+            auth_service.password_authenticate("admin@example.com", "correct-password")
+            auth_service.password_authenticate("admin@example.com", "correct-password")
+
+        load_errors = [
+            record
+            for record in caplog.records
+            if "not an argon2 hash" in record.getMessage()
+        ]
+        assert len(load_errors) == 1
+
+
+# ============================================================================
+# TOKEN CACHE TESTS
+# ============================================================================
+
+
+def _credentials(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def _token_info(token: str, expires_in: timedelta) -> TokenInfo:
+    return TokenInfo(
+        id="7d9b2a1c-3e4f-4a5b-8c6d-9e0f1a2b3c4d",
+        token=hash_token(token),
+        expiry=datetime.now(timezone.utc) + expires_in,
+    )
+
+
+@pytest.fixture
+def token_cache():
+    _token_cache._cache.clear()
+    yield _token_cache
+    _token_cache._cache.clear()
+
+
+class TestTokenCache:
+    """Test the per-process cache in front of AdminAccessTokens lookups"""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_database(self, token_cache):
+        cached = _token_info("raw-token", timedelta(hours=1))
+        token_cache.put(cached)
+        session = AsyncMock()
+
+        result = await verify_jwt_token(session, _credentials("raw-token"))
+
+        assert result == cached
+        session.scalar.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cached_dependency_opens_no_session_on_hit(self, token_cache):
+        cached = _token_info("raw-token", timedelta(hours=1))
+        token_cache.put(cached)
+
+        with patch("apps.auth.dependency.AsyncSessionLocal") as session_factory:
+            result = await verify_cached_token(_credentials("raw-token"))
+
+        assert result == cached
+        session_factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_jwt_evicts_entry(self, token_cache):
+        cached = _token_info("raw-token", timedelta(hours=1))
+        token_cache.put(cached)
+        session = AsyncMock()
+        session.scalar.return_value = Mock()
+
+        assert await AuthService(session=session).invalidate_jwt(cached.token)
+
+        assert token_cache.get(cached.token) is None
+        session.delete.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_token_is_not_served_from_cache(self, token_cache):
+        expired = _token_info("raw-token", timedelta(seconds=-1))
+        token_cache.put(expired)
+        session = AsyncMock()
+        # The database no longer returns the expired row either
+        session.scalar.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await verify_jwt_token(session, _credentials("raw-token"))
+
+        assert exc_info.value.status_code == 401
+        session.scalar.assert_awaited_once()
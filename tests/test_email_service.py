@@ -8,18 +8,23 @@ Run with:
 
 import pytest
 import asyncio
+import uuid
+from types import SimpleNamespace
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime, timezone
+from sqlalchemy import DefaultClause, event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from core.notifications.email import EmailService
-from apps.notifications.service import NotificationService
+from apps.notifications.service import NotificationService, drain_pending_emails
 from apps.notifications.models import EmailLog
+from apps.auth.models import AdminAccessTokens
 from apps.donation.models import Donation
 from apps.donation.schema import DonationStatus
 from apps.payments.models import SbiePayPaymentLog
 from apps.payments.schema import SbiePayPaymentStatus
+from apps.payments import service as payment_service_module
 from apps.payments.service import PaymentService
 from core.database.sqlalchamey.base import AbstractSQLModel
 
@@ -66,14 +71,25 @@ def email_service_mock():
 
 
 @pytest.fixture
-async def async_session():
+async def async_session(monkeypatch):
     """Create an in-memory async database session for testing"""
+    # Token expiry defaults to Postgres' now() + interval; give SQLite its own
+    monkeypatch.setattr(
+        AdminAccessTokens.__table__.c.expiry,
+        "server_default",
+        DefaultClause(text("(datetime('now', '+1 day'))")),
+    )
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
 
+    # Primary keys default to Postgres' gen_random_uuid(); provide it in SQLite
+    @event.listens_for(engine.sync_engine, "connect")
+    def register_gen_random_uuid(dbapi_connection, connection_record):
+        dbapi_connection.create_function("gen_random_uuid", 0, lambda: uuid.uuid4().hex)
+
     async with engine.begin() as conn:
         await conn.run_sync(AbstractSQLModel.metadata.create_all)
 
@@ -91,7 +107,7 @@ async def async_session():
 def sample_donation():
     """Create a sample donation for testing"""
     return Donation(
-        id="donation-123",
+        id="6f1c1d2e-8a3b-4c5d-9e7f-0a1b2c3d4e5f",
         order_id="SK-1234567890ABCD",
         full_name="Test User",
         email="test@example.com",
@@ -108,7 +124,7 @@ def sample_donation():
 def sample_payment_log():
     """Create a sample SBIePay payment log for testing"""
     return SbiePayPaymentLog(
-        id="payment-123",
+        id="0c9d8e7f-6a5b-4c3d-8e2f-1a0b9c8d7e6f",
         merchant_order_id="SK-1234567890ABCD",
         encrypted_trans="encrypted_data",
         payment_status=SbiePayPaymentStatus.SUCCESS.value,
@@ -218,7 +234,7 @@ class TestNotificationService:
             service.session = async_session
             service.email_service = email_service_mock
 
-            email_log = await service.send_email(
+            email_log = await service.send_email_sync(
                 recipient_email="test@example.com",
                 subject="Test Subject",
                 html_body="<html>Test</html>",
@@ -246,7 +262,7 @@ class TestNotificationService:
                 "amount": "1,000.00",
             }
 
-            email_log = await service.send_template_email(
+            email_log = await service.send_template_email_sync(
                 recipient_email="test@example.com",
                 subject="Thank You",
                 template_name="donation_thank_you.html",
@@ -278,7 +294,7 @@ class TestNotificationService:
             service.session = async_session
             service.email_service = email_service_mock
 
-            email_log = await service.send_email(
+            email_log = await service.send_email_sync(
                 recipient_email="test@example.com",
                 subject="Test Subject",
                 html_body="<html>Test</html>",
@@ -288,6 +304,89 @@ class TestNotificationService:
             assert email_log.status == "failed"
             assert email_log.error_message == "Email sending failed"
 
+    @pytest.mark.asyncio
+    async def test_send_email_in_background(self, async_session, email_service_mock):
+        """Test that send_email returns a pending log and records the result later"""
+        session_factory = async_sessionmaker(
+            async_session.bind, class_=AsyncSession, expire_on_commit=False
+        )
+        with patch.object(
+            NotificationService, "__init__", lambda self, session, **kwargs: None
+        ), patch("apps.notifications.service.AsyncSessionLocal", session_factory):
+            service = NotificationService(session=async_session)
+            service.session = async_session
+            service.email_service = email_service_mock
+
+            email_log = await service.send_email(
+                recipient_email="test@example.com",
+                subject="Test Subject",
+                html_body="<html>Test</html>",
+                mail_type="test",
+            )
+
+            assert email_log.status == "pending"
+
+            await drain_pending_emails()
+            await async_session.refresh(email_log)
+
+            assert email_log.status == "sent"
+            assert email_log.message_id == "mock-message-id-12345"
+
+    @pytest.mark.asyncio
+    async def test_send_template_email_bulk(self, async_session, email_service_mock):
+        """Test that bulk sending logs every recipient with its own result"""
+        results = {
+            "first@example.com": {
+                "success": True,
+                "message_id": "bulk-1",
+                "status": "sent",
+            },
+            "second@example.com": {
+                "success": False,
+                "error_message": "Rejected",
+                "status": "failed",
+            },
+        }
+        email_service_mock.send_email = Mock(
+            side_effect=lambda recipient_email, **kwargs: results[recipient_email]
+        )
+
+        with patch.object(
+            NotificationService, "__init__", lambda self, session, **kwargs: None
+        ):
+            service = NotificationService(session=async_session)
+            service.session = async_session
+            service.email_service = email_service_mock
+
+            email_logs = await service.send_template_email_bulk(
+                items=[
+                    {
+                        "recipient_email": "first@example.com",
+                        "context": {"order_id": "SK-1"},
+                    },
+                    {
+                        "recipient_email": "second@example.com",
+                        "context": {"order_id": "SK-2"},
+                        "metadata": {"order_id": "SK-2"},
+                    },
+                ],
+                template_name="donation_thank_you.html",
+                subject_fn=lambda context: f"Thank You - {context['order_id']}",
+                mail_type="donation_thank_you",
+            )
+
+            assert [log.recipient_email for log in email_logs] == [
+                "first@example.com",
+                "second@example.com",
+            ]
+            assert email_logs[0].status == "sent"
+            assert email_logs[0].message_id == "bulk-1"
+            assert email_logs[0].subject == "Thank You - SK-1"
+            assert email_logs[1].status == "failed"
+            assert email_logs[1].error_message == "Rejected"
+            assert email_logs[1].additional_data == {"order_id": "SK-2"}
+            assert email_service_mock.render_template.call_count == 2
+
 
 # ============================================================================
 # PAYMENT SERVICE EMAIL TESTS
@@ -460,6 +559,141 @@ class TestPaymentServiceEmail:
             assert result is False
 
 
+# ============================================================================
+# SBIEPAY CALLBACK TESTS
+# ============================================================================
+
+
+def _sbiepay_callback(order_id: str, transaction_status: str, atrn: str) -> dict:
+    """Decrypted SBIePay callback as returned by `handle_payment_response`"""
+    return {
+        "status": "success",
+        "data": SimpleNamespace(
+            merchant_order_number=order_id,
+            sbiepay_ref_id=atrn,
+            pay_mode="NB",
+            reason_message="",
+            other_details="",
+            bank_code="SBI",
+            bank_reference_number=f"REF-{atrn}",
+            transaction_date="2026-01-01 10:00:00",
+            transaction_status=transaction_status,
+        ),
+        "raw_data": {"atrn": atrn},
+    }
+
+
+class TestSbiePayCallbacks:
+    """Test that SBIePay callbacks settle a payment once and email once"""
+
+    ORDER_ID = "SK-CALLBACK000001"
+
+    async def _setup(self, async_session, payment_status: str):
+        donation = Donation(
+            order_id=self.ORDER_ID,
+            full_name="Test User",
+            email="test@example.com",
+            contact_number="9876543210",
+            amount=1000.0,
+            need_g80_certificate=False,
+            confirmed_terms=True,
+            status=(
+                DonationStatus.COMPLETED.value
+                if payment_status == SbiePayPaymentStatus.SUCCESS.value
+                else DonationStatus.PENDING.value
+            ),
+            payment_provider="sbiepay",
+        )
+        payment_log = SbiePayPaymentLog(
+            merchant_order_id=self.ORDER_ID,
+            encrypted_trans="encrypted_data",
+            payment_status=payment_status,
+            amount=1000.0,
+        )
+        async_session.add_all([donation, payment_log])
+        await async_session.commit()
+
+        with patch.object(
+            PaymentService,
+            "__init__",
+            lambda self, session, notification_service, **kwargs: None,
+        ):
+            service = PaymentService(
+                session=async_session, notification_service=AsyncMock()
+            )
+        service.session = async_session
+        return service, donation
+
+    async def _callback(self, service, transaction_status: str, atrn: str):
+        with patch.object(
+            payment_service_module.sbiepay_client,
+            "handle_payment_response",
+            AsyncMock(
+                return_value=_sbiepay_callback(self.ORDER_ID, transaction_status, atrn)
+            ),
+        ):
+            return await service.handle_sbiepay_response("encrypted")
+
+    @pytest.mark.asyncio
+    async def test_settled_payment_is_not_downgraded(self, async_session):
+        """A late callback for a SUCCESS payment changes nothing and sends no email"""
+        service, donation = await self._setup(
+            async_session, SbiePayPaymentStatus.SUCCESS.value
+        )
+
+        with patch.object(PaymentService, "_queue_donation_thank_you_email") as queue:
+            payment_log = await self._callback(service, "FAIL", "ATRN-LATE")
+
+            assert payment_log.payment_status == SbiePayPaymentStatus.SUCCESS.value
+            assert payment_log.sbiepay_ref_id is None
+            assert donation.status == DonationStatus.COMPLETED.value
+
+            payment_log = await self._callback(service, "SUCCESS", "ATRN-1")
+
+        assert payment_log.payment_status == SbiePayPaymentStatus.SUCCESS.value
+        assert payment_log.sbiepay_ref_id is None
+        queue.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_pending_to_success_emails_once(self, async_session):
+        """Settling a pending payment queues exactly one thank you email"""
+        service, donation = await self._setup(
+            async_session, SbiePayPaymentStatus.PENDING.value
+        )
+
+        with patch.object(PaymentService, "_queue_donation_thank_you_email") as queue:
+            payment_log = await self._callback(service, "SUCCESS", "ATRN-1")
+            # The other callback for the same payment arrives as well
+            await self._callback(service, "SUCCESS", "ATRN-1")
+
+        assert payment_log.payment_status == SbiePayPaymentStatus.SUCCESS.value
+        assert payment_log.sbiepay_ref_id == "ATRN-1"
+        assert donation.status == DonationStatus.COMPLETED.value
+        queue.assert_called_once()
+        assert queue.call_args.args[0].order_id == self.ORDER_ID
+
+    @pytest.mark.asyncio
+    async def test_failed_then_success(self, async_session):
+        """A retried payment moves from FAILED to SUCCESS and emails once"""
+        service, donation = await self._setup(
+            async_session, SbiePayPaymentStatus.PENDING.value
+        )
+
+        with patch.object(PaymentService, "_queue_donation_thank_you_email") as queue:
+            payment_log = await self._callback(service, "FAIL", "ATRN-1")
+
+            assert payment_log.payment_status == SbiePayPaymentStatus.FAILED.value
+            assert donation.status == DonationStatus.PAYMENT_FAILED.value
+            queue.assert_not_called()
+
+            payment_log = await self._callback(service, "SUCCESS", "ATRN-2")
+
+        assert payment_log.payment_status == SbiePayPaymentStatus.SUCCESS.value
+        assert payment_log.sbiepay_ref_id == "ATRN-2"
+        assert donation.status == DonationStatus.COMPLETED.value
+        queue.assert_called_once()
+
+
 # ============================================================================
 # INTEGRATION TESTS
 # ============================================================================